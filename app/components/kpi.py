@@ -1,13 +1,13 @@
 import numpy as np
+import pandas as pd
 import streamlit as st
 
-import numpy as np
-import streamlit as st
+import utils.matchups as matchups
 
 
 def kpi_card(player_name:str, stat_label: str, total_value, avg_value, total_rank, avg_rank, display_mode: str,
-             comp_total=None, comp_avg=None):
-    """KPI card showing either Total, Average, or a toggleable view."""
+             comp_total=None, comp_avg=None, total_pct=None, avg_pct=None, total_z=None, avg_z=None):
+    """KPI card showing either Total, Average, or a toggleable view, with percentile context."""
     unique_id = player_name + stat_label
 
     # Ensure values are properly rounded
@@ -27,24 +27,49 @@ def kpi_card(player_name:str, stat_label: str, total_value, avg_value, total_ran
             show_total = display_mode == "total"
 
         if show_total: #TOTAL STATS
+            rank_text = rank_context(total_rank, total_pct)
+            help_text = zscore_help(total_z)
             # if comparison mode
             if comp_total:
                 delta_val = np.round(total_value - comp_total, 2)
                 st.metric(label=f"Total {stat_label}",
                           value=total_value,
-                          delta=f"{delta_val} (Rank {int(total_rank)})",
-                          delta_color= "normal")
+                          delta=f"{delta_val} ({rank_text})",
+                          delta_color= "normal",
+                          help=help_text)
             else:
-                st.metric(label=f"Total {stat_label}", value=total_value, delta=f"Rank {int(total_rank)}", delta_color="off")
+                st.metric(label=f"Total {stat_label}", value=total_value, delta=rank_text, delta_color="off",
+                          help=help_text)
         else: #AVERAGE STATS
+            rank_text = rank_context(avg_rank, avg_pct)
+            help_text = zscore_help(avg_z)
             if comp_avg:
                 delta_val = np.round(avg_value - comp_avg)
                 st.metric(label=f"Avg {stat_label}",
                           value=avg_value,
-                          delta=f"{delta_val} (Rank {int(avg_rank)})",
-                          delta_color="normal")
+                          delta=f"{delta_val} ({rank_text})",
+                          delta_color="normal",
+                          help=help_text)
             else:
-                st.metric(label=f"Avg {stat_label}", value=avg_value, delta=f"Rank {int(avg_rank)}", delta_color="off")
+                st.metric(label=f"Avg {stat_label}", value=avg_value, delta=rank_text, delta_color="off",
+                          help=help_text)
+
+
+def rank_context(rank, percentile=None):
+    """'Rank 4 · 92nd pct' style label; the percentile is dropped when unavailable."""
+    if rank is None or np.isnan(rank):
+        return "Unranked"
+    if percentile is None or np.isnan(percentile):
+        return f"Rank {int(rank)}"
+    pct = int(percentile)
+    suffix = "th" if 10 <= pct % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(pct % 10, "th")
+    return f"Rank {int(rank)} · {pct}{suffix} pct"
+
+
+def zscore_help(zscore=None):
+    if zscore is None or np.isnan(zscore):
+        return None
+    return f"{zscore:+.2f} standard deviations from the qualified average at this position"
 
 
 
@@ -63,6 +88,10 @@ def make_cards_from_stats(player, stat_dict, comp_player=None):
     player_totals_ranks = tables["position_ranks_totals"].query("player_display_name == @player['name']")
     player_averages = tables["player_stat_averages"]
     player_averages_ranks = tables["position_ranks_averages"].query("player_display_name == @player['name']")
+    player_totals_pcts = tables["position_percentiles_totals"].query("player_display_name == @player['name']")
+    player_averages_pcts = tables["position_percentiles_averages"].query("player_display_name == @player['name']")
+    player_totals_z = tables["position_zscores_totals"].query("player_display_name == @player['name']")
+    player_averages_z = tables["position_zscores_averages"].query("player_display_name == @player['name']")
 
     if comp_player: # get just the ranks for comparison
         comp_tables = comp_player["tables"]
@@ -80,6 +109,8 @@ def make_cards_from_stats(player, stat_dict, comp_player=None):
 
             avg_value = round(player_averages[key], 2)
             avg_rank = player_averages_ranks[key].iloc[0]
+            total_pct, avg_pct = player_totals_pcts[key].iloc[0], player_averages_pcts[key].iloc[0]
+            total_z, avg_z = player_totals_z[key].iloc[0], player_averages_z[key].iloc[0]
 
             if comp_player:
                 comp_total = comp_player_totals[key]
@@ -89,7 +120,7 @@ def make_cards_from_stats(player, stat_dict, comp_player=None):
 
             with col:
                 kpi_card(player['name'], label, total_value, avg_value, total_rank, avg_rank, display_mode,
-                                                        comp_total, comp_avg)
+                                                        comp_total, comp_avg, total_pct, avg_pct, total_z, avg_z)
 
 
 def player_kpis(page_key, player_index=0, comp_player_index=None):
@@ -109,6 +140,24 @@ def player_kpis(page_key, player_index=0, comp_player_index=None):
 
 
 
+def opponent_adjusted_table(page_key, player_index=0):
+    """Per-game KPIs next to their opponent-adjusted values for the selected weeks."""
+    state = getattr(st.session_state, page_key)
+    player = state["players"][player_index]
+    raw = player["tables"]["player_stat_averages"]
+    adjusted = player["tables"]["player_stat_averages_adjusted"]
+
+    stat_dict = get_position_kpis(player["position"])
+    stats = [stat for stat in stat_dict if stat in matchups.DVP_STATS]
+    table = pd.DataFrame({
+        "Stat": [stat_dict[stat][0] for stat in stats],
+        "Per Game": [raw[stat] for stat in stats],
+        "Opponent-Adjusted": [adjusted[stat] for stat in stats],
+    })
+    table["Difference"] = table["Opponent-Adjusted"] - table["Per Game"]
+    st.dataframe(table.round(2), hide_index=True, use_container_width=True)
+
+
 def get_position_kpis(position:str):
     if position in [ 'WR', 'TE']:
         stat_dict = {
@@ -56,6 +56,23 @@ def year_selector(page_key: str):
     )
 
 
+def min_games_selector(page_key: str):
+    """
+    Displays a number input for the games needed to qualify for rank and percentile pools.
+
+    Args:
+        page_key (str): The key to identify the page's state.
+    """
+    st.number_input(
+        "Min Games to Qualify",
+        min_value=1, max_value=22, step=1,
+        value=getattr(st.session_state, page_key)["min_games"],
+        key="min_games",
+        on_change=data_loader.handle_min_games_change,
+        args=(page_key,)
+    )
+
+
 def player_selector(page_key: str,
                     player_index:int=0,
                     label_visibility='visible'):
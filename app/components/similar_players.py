@@ -0,0 +1,38 @@
+import streamlit as st
+
+import components.kpi as kpi
+import utils.data_loader as data_loader
+
+ALL_SEASONS = tuple(range(1999, 2025))
+
+
+def similar_players(page_key, player_index=0, k=5):
+    """Panel listing the players with the closest per-game KPI profile at the same position."""
+    state = getattr(st.session_state, page_key)
+    player = state["players"][player_index]
+    stats = tuple(kpi.get_position_kpis(player["position"]).keys())
+
+    st.subheader("Most Similar Players")
+    option_cols = st.columns(2)
+    with option_cols[0]:
+        all_seasons = st.toggle("Search all seasons (1999–2024)", key=f"similar_all_seasons_{page_key}")
+    with option_cols[1]:
+        metric = st.radio("Metric", ["cosine", "euclidean"], horizontal=True, key=f"similar_metric_{page_key}")
+
+    years = ALL_SEASONS if all_seasons else (state["selected_year"],)
+    # Rebuilt only when the seasons, format or position change; each query is one product over the matrix
+    versions = tuple(data_loader.season_version(year) for year in years)  # Also stores missing seasons
+    scoring_format = state["selected_scoring_format"]
+    index = data_loader.load_similarity_index(years, versions, scoring_format, scoring_format.cache_key(),
+                                              state["stat_mapping"], player["position"], stats)
+
+    player_data = player["tables"]["player_data"]
+    neighbours = index.top_k(player["tables"]["player_stat_averages"], k=k, metric=metric,
+                             exclude=(player_data["player_id"].iloc[0], state["selected_year"]))
+
+    labels = kpi.get_position_kpis(player["position"])
+    neighbours = neighbours.rename(columns={stat: labels[stat][0] for stat in stats} | {
+        "player_display_name": "Player", "season": "Season", "recent_team": "Team", "games": "Games",
+        "similarity": "Similarity", "distance": "Distance"
+    }).drop(columns="player_id")
+    st.dataframe(neighbours.round(2), hide_index=True, use_container_width=True)
@@ -188,3 +188,44 @@ def custom_bar(page_key,
 
 
 
+def trend_chart(page_key,
+                player_index=0):
+    st.subheader("Trends")
+    player = getattr(st.session_state, page_key)["players"][player_index]
+    player_trends = player["tables"]["player_trends"]
+    consistency = player["tables"]["player_consistency"]
+
+    trend_stats = [col[:-len("_roll")] for col in player_trends.columns
+                   if col.endswith("_roll") and player_trends[col[:-len("_roll")]].any()]
+    stat = st.selectbox(
+        "Select a stat to trend:",
+        options=trend_stats,
+        format_func=lambda col: col.replace("calc_", "").replace("_", " ").title(),
+        key=f"trend_stat_{page_key}_{player_index}",
+    )
+
+    # Windows are precomputed for every player in utils.metrics; only read them here
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=player_trends["week"], y=player_trends[stat], name="Weekly",
+                         marker=dict(color="rgba(255,215,0,0.35)")))
+    fig.add_trace(go.Scatter(x=player_trends["week"], y=player_trends[f"{stat}_roll"], name="Rolling Avg",
+                             line=dict(color="#FFD700", width=2)))
+    fig.add_trace(go.Scatter(x=player_trends["week"], y=player_trends[f"{stat}_ewm"], name="EWMA",
+                             line=dict(color="#1E90FF", width=2, dash="dot")))
+    fig.add_hline(y=consistency[f"{stat}_floor"], line=dict(color="rgba(255,255,255,0.3)", dash="dash"))
+    fig.add_hline(y=consistency[f"{stat}_ceiling"], line=dict(color="rgba(255,255,255,0.3)", dash="dash"))
+    fig.update_layout(
+        height=300,
+        margin=dict(l=20, r=20, t=20, b=20),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5),
+        template="plotly_dark"
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    cols = st.columns(5)
+    cols[0].metric("Std Dev", round(float(consistency[f"{stat}_std"]), 2))
+    cols[1].metric("Floor (P10)", round(float(consistency[f"{stat}_floor"]), 2))
+    cols[2].metric("Ceiling (P90)", round(float(consistency[f"{stat}_ceiling"]), 2))
+    cols[3].metric("Boom Rate", f"{consistency[f'{stat}_boom_rate']:.0%}")
+    cols[4].metric("Bust Rate", f"{consistency[f'{stat}_bust_rate']:.0%}")
+
@@ -1,5 +1,6 @@
 import streamlit as st
-from utils.scoring import ScoringFormat
+from utils.scoring import ScoringFormat, dump_scoring_formats
+from utils.scoring_rules import BonusRule, LinearRule, PositionPremiumRule
 
 st.title("Create Custom Scoring Format")
 
@@ -22,10 +23,17 @@ def create_custom_scoring():
         fumble_recovery_td_value = st.number_input("Fumble Recovery TDs (pts each)", value=6, step=1)
         fumble_lost_value = st.number_input("Fumbles Lost (pts each)", value=-2, step=1)
 
+        st.write("### Bonuses & Premiums")
+        pass_300_bonus = st.number_input("300+ Passing Yards Bonus (pts)", value=0.0, step=1.0)
+        rush_100_bonus = st.number_input("100+ Rushing Yards Bonus (pts)", value=0.0, step=1.0)
+        rec_100_bonus = st.number_input("100+ Receiving Yards Bonus (pts)", value=0.0, step=1.0)
+        te_premium = st.number_input("TE Premium (extra pts per reception)", value=0.0, step=0.25)
+        first_down_value = st.number_input("First Downs (pts each)", value=0.0, step=0.25)
+
         submitted = st.form_submit_button("Create Custom Format")
 
     if submitted and name:
-        if name in st.session_state.scoring_formats:
+        if name in [scoring_format.name for scoring_format in st.session_state.scoring_formats]:
             st.warning(f"A scoring format named '{name}' already exists. Choose a different name.")
         else:
             scoring_values = {
@@ -42,7 +50,18 @@ def create_custom_scoring():
                 "fumble_lost_value": fumble_lost_value
             }
 
-            new_format = ScoringFormat(name=name, **scoring_values)
+            rules = [
+                BonusRule("passing_yards", 300, pass_300_bonus),
+                BonusRule("rushing_yards", 100, rush_100_bonus),
+                BonusRule("receiving_yards", 100, rec_100_bonus),
+                PositionPremiumRule("receptions", ("TE",), te_premium),
+                LinearRule("passing_first_downs", first_down_value),
+                LinearRule("rushing_first_downs", first_down_value),
+                LinearRule("receiving_first_downs", first_down_value),
+            ]
+            rules = [rule for rule in rules if getattr(rule, "points", getattr(rule, "per_unit", 0))]
+
+            new_format = ScoringFormat(name=name, rules=rules, **scoring_values)
             st.session_state.scoring_formats.append(new_format)
             st.success(f"Custom scoring format '{name}' created!")
 
@@ -58,3 +77,11 @@ scoring_format_cols = st.columns(scoring_format_n_cols)
 for i in range(scoring_format_n_cols):
     with scoring_format_cols[i]:
         st.write(st.session_state.scoring_formats[i].to_markdown())
+
+# Export the saved formats for the headless batch scorer (python -m utils.batch --formats <file>)
+st.download_button(
+    "Export Scoring Formats",
+    data=dump_scoring_formats(st.session_state.scoring_formats),
+    file_name="scoring_formats.json",
+    mime="application/json",
+)
@@ -0,0 +1,42 @@
+import streamlit as st
+
+import components.selectas as selectas
+import utils.data_loader as data_loader
+import utils.matchups as matchups
+import utils.memory as memory
+
+st.title("Defense vs Position")
+
+if "defense_vs_position" not in st.session_state:
+    data_loader.init_state("defense_vs_position")
+data_loader.sync_data_version("defense_vs_position")
+memory.track_page("defense_vs_position")
+
+selector_cols = st.columns(4)
+with selector_cols[0]:
+    selectas.format_selector("defense_vs_position")
+with selector_cols[1]:
+    selectas.week_selector("defense_vs_position")
+with selector_cols[2]:
+    selectas.year_selector("defense_vs_position")
+with selector_cols[3]:
+    position = st.selectbox("Position", ["QB", "RB", "WR", "TE"], key="dvp_position")
+
+state = st.session_state.defense_vs_position
+scoring_format = state["selected_scoring_format"]
+defense_prefix = data_loader.load_defense_prefix(state["selected_year"], state["data_version"], scoring_format,
+                                                 scoring_format.cache_key(), state["stat_mapping"])
+# A week window is a subtraction of two prefix slices; no regrouping on slider moves
+table = matchups.defense_vs_position(defense_prefix.window(state["selected_weeks"]), position)
+
+stat = st.selectbox("Sort By", defense_prefix.stats,
+                    format_func=lambda col: col.replace("calc_", "").replace("_", " ").title())
+table = table.sort_values(stat, ascending=False)
+
+display_columns = ["defense", "games", f"{stat}_rank", f"{stat}_vs_avg"] + defense_prefix.stats
+st.dataframe(
+    table[display_columns].rename(columns={
+        "defense": "Defense", "games": "Games", f"{stat}_rank": "Rank", f"{stat}_vs_avg": "vs League Avg",
+    } | {s: f"{s.replace('calc_', '').replace('_', ' ').title()} / G" for s in defense_prefix.stats}).round(2),
+    hide_index=True, use_container_width=True, height=600,
+)
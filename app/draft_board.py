@@ -0,0 +1,46 @@
+import streamlit as st
+
+import components.selectas as selectas
+import utils.data_loader as data_loader
+import utils.draft as draft
+import utils.memory as memory
+
+st.title("Draft Board")
+
+if "draft_board" not in st.session_state:
+    data_loader.init_state("draft_board")
+data_loader.sync_data_version("draft_board")
+memory.track_page("draft_board")
+
+state = st.session_state.draft_board
+scoring_formats = tuple(st.session_state.scoring_formats)
+totals, sorted_by_format = data_loader.load_format_totals(
+    state["selected_year"], state["data_version"], scoring_formats, tuple(f.cache_key() for f in scoring_formats),
+    state["stat_mapping"])
+
+settings_cols = st.columns([2, 1, 1, 1, 1, 1, 2])
+with settings_cols[0]:
+    selectas.year_selector("draft_board")
+with settings_cols[1]:
+    teams = st.number_input("Teams", min_value=4, max_value=20, value=12, step=1)
+slots = {}
+for col, position in zip(settings_cols[2:], draft.DEFAULT_SLOTS):
+    with col:
+        slots[position] = st.number_input(position, min_value=0, max_value=4, value=draft.DEFAULT_SLOTS[position],
+                                          step=1)
+with settings_cols[6]:
+    sort_format = st.selectbox("Rank By", [f.name for f in scoring_formats])
+
+# Only replacement-level lookups run here; the per-format totals are cached per season
+board = draft.draft_board(totals, sorted_by_format, teams, slots)
+positions = st.multiselect("Positions", draft.DRAFT_POSITIONS, default=draft.DRAFT_POSITIONS)
+board = board.loc[board["position"].isin(positions)].sort_values(f"{sort_format} VORP", ascending=False)
+
+columns = ["player_display_name", "position", "recent_team", "games"]
+for scoring_format in scoring_formats:
+    columns += [scoring_format.name, f"{scoring_format.name} VORP", f"{scoring_format.name} Rank"]
+st.dataframe(
+    board[columns].rename(columns={"player_display_name": "Player", "position": "Pos", "recent_team": "Team",
+                                   "games": "Games"}).round(1),
+    hide_index=True, use_container_width=True, height=600,
+)
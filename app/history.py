@@ -0,0 +1,48 @@
+import streamlit as st
+
+import utils.analytics as analytics
+import utils.data_loader as data_loader
+import utils.scoring as scoring
+
+st.title("All-Time Leaders")
+
+if not analytics.available():
+    st.info("All-history queries need the optional DuckDB engine: `poetry install -E analytics`.")
+    st.stop()
+
+versions = data_loader.store_versions()
+stored_years = [year for year, _ in versions]
+if not stored_years:
+    st.info("No seasons are stored yet. Open a season on any other page to download it.")
+    st.stop()
+st.caption(f"Querying {len(stored_years)} stored seasons ({min(stored_years)}-{max(stored_years)}) "
+           "directly from disk.")
+
+scoring_formats = st.session_state.scoring_formats
+stat_mapping = scoring.stat_mapping_nfl_py
+
+settings_cols = st.columns([2, 2, 1])
+with settings_cols[0]:
+    scoring_format = st.selectbox("Scoring Format", scoring_formats, format_func=lambda f: f.name)
+with settings_cols[1]:
+    if len(stored_years) > 1:
+        since, until = st.slider("Seasons", min_value=min(stored_years), max_value=max(stored_years),
+                                 value=(max(min(stored_years), 2010), max(stored_years)))
+    else:
+        since = until = stored_years[0]
+with settings_cols[2]:
+    position = st.selectbox("Position", [None, "QB", "RB", "WR", "TE"], format_func=lambda p: p or "All")
+
+career_tab, stretch_tab = st.tabs(["Career Totals", "Best Stretches"])
+
+with career_tab:
+    career = data_loader.load_career_totals(versions, scoring_format, scoring_format.cache_key(), stat_mapping,
+                                            tuple(analytics.CAREER_STATS), since, until, position)
+    st.dataframe(career.drop(columns="player_id").head(200).round(1), hide_index=True,
+                 use_container_width=True, height=600)
+
+with stretch_tab:
+    weeks = st.number_input("Consecutive Games", min_value=2, max_value=17, value=10, step=1)
+    stretches = data_loader.load_best_stretches(versions, scoring_format, scoring_format.cache_key(), stat_mapping,
+                                                int(weeks), since, until, position)
+    st.dataframe(stretches, hide_index=True, use_container_width=True, height=600)
@@ -0,0 +1,105 @@
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+import utils.data_loader as data_loader
+import utils.explorer as explorer
+import utils.scoring as scoring
+
+st.title("KPI Explorer")
+
+versions = data_loader.store_versions()
+if not versions:
+    st.info("No seasons are stored yet. Open a season on any other page to download it.")
+    st.stop()
+
+position_colors = {"QB": "#FFD700", "RB": "#1E90FF", "WR": "#32CD32", "TE": "#FF6347"}
+settings_cols = st.columns([2, 2, 2, 2, 3])
+with settings_cols[0]:
+    x_stat = st.selectbox("X Axis", explorer.EXPLORER_STATS, index=explorer.EXPLORER_STATS.index("targets"))
+with settings_cols[1]:
+    y_stat = st.selectbox("Y Axis", explorer.EXPLORER_STATS, index=0)
+with settings_cols[2]:
+    level = st.radio("Each Point Is", ["week", "season"], horizontal=True,
+                     format_func=lambda l: "Player-Week" if l == "week" else "Player-Season")
+with settings_cols[3]:
+    scoring_format = st.selectbox("Scoring Format", st.session_state.scoring_formats, format_func=lambda f: f.name)
+with settings_cols[4]:
+    positions = st.multiselect("Positions", list(position_colors), default=list(position_colors))
+
+stats = tuple(dict.fromkeys([x_stat, y_stat]))
+points, players = data_loader.load_explorer_population(versions, scoring_format, scoring_format.cache_key(),
+                                                       scoring.stat_mapping_nfl_py, stats, level)
+position_mask = players["position"].isin(positions).to_numpy()[points["player"].to_numpy()]
+points = points.loc[position_mask]
+
+# The view window lives on the server: box-selecting zooms in, so the browser only ever
+# receives what is visible, as raw points or as density bins.
+view_key = (x_stat, y_stat, level)
+if st.session_state.get("explorer_view_key") != view_key:
+    st.session_state.explorer_view_key = view_key
+    st.session_state.explorer_view = None
+    st.session_state.explorer_chart = st.session_state.get("explorer_chart", 0) + 1
+full_view = ((float(points[x_stat].min()), float(points[x_stat].max())),
+             (float(points[y_stat].min()), float(points[y_stat].max()))) if len(points) else ((0.0, 1.0), (0.0, 1.0))
+x_range, y_range = st.session_state.explorer_view or full_view
+
+visible = points.loc[explorer.in_view(points, x_stat, y_stat, x_range, y_range)]
+binned = len(visible) > explorer.MAX_POINTS
+
+fig = go.Figure()
+if binned:
+    cells = explorer.bin_view(visible, x_stat, y_stat, x_range, y_range)
+    fig.add_trace(go.Scattergl(
+        x=cells["x"].round(3), y=cells["y"].round(3), mode="markers",
+        marker=dict(symbol="square", size=6, color=np.log10(cells["count"]), colorscale="Viridis",
+                    colorbar=dict(title="Points", tickvals=[0, 1, 2, 3, 4], ticktext=["1", "10", "100", "1k", "10k"])),
+        customdata=cells[["ix", "iy", "count"]].to_numpy(),
+        hovertemplate="%{customdata[2]} points<extra></extra>",
+    ))
+else:
+    # Hover labels are resolved through the player index for the visible points only
+    labeled = explorer.resolve_points(visible, players)
+    when = labeled["season"].astype(str) + np.where(labeled["week"] > 0, " W" + labeled["week"].astype(str), "")
+    for position in positions:
+        rows = (labeled["position"] == position).to_numpy()
+        fig.add_trace(go.Scattergl(
+            x=visible.loc[rows, x_stat].round(2), y=visible.loc[rows, y_stat].round(2), mode="markers",
+            name=position, marker=dict(size=5, color=position_colors[position], opacity=0.7),
+            hovertext=(labeled.loc[rows, "player_display_name"] + " " + when[rows]).to_numpy(),
+            customdata=np.flatnonzero(rows)[:, None],
+            hovertemplate="%{hovertext}<br>%{x}, %{y}<extra></extra>",
+        ))
+fig.update_layout(height=600, margin=dict(l=20, r=20, t=20, b=20), template="plotly_dark", dragmode="select",
+                  xaxis=dict(title=x_stat, range=x_range), yaxis=dict(title=y_stat, range=y_range),
+                  legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5))
+
+info_cols = st.columns([4, 1])
+with info_cols[0]:
+    st.caption(f"{len(visible):,} of {len(points):,} points in view"
+               + (f", drawn as density bins (zoom below {explorer.MAX_POINTS:,} to see players)." if binned else ".")
+               + " Box-select to zoom in; click points to list them.")
+with info_cols[1]:
+    if st.button("Reset Zoom", use_container_width=True):
+        st.session_state.explorer_view = None
+        st.session_state.explorer_chart += 1
+        st.rerun()
+
+event = st.plotly_chart(fig, use_container_width=True, on_select="rerun", selection_mode=("box", "points"),
+                        key=f"explorer_chart_{st.session_state.explorer_chart}")
+
+selection = event.selection if event else None
+if selection and selection["box"]:
+    box = selection["box"][0]
+    st.session_state.explorer_view = (tuple(sorted(box["x"])), tuple(sorted(box["y"])))
+    st.session_state.explorer_chart += 1
+    st.rerun()
+elif selection and selection["points"]:
+    if binned:
+        cells = [(int(p["customdata"][0]), int(p["customdata"][1])) for p in selection["points"]]
+        picked = visible.loc[explorer.bin_members(visible, x_stat, y_stat, x_range, y_range, cells)]
+    else:
+        picked = visible.iloc[[int(p["customdata"][0]) for p in selection["points"]]]
+    st.subheader("Selected")
+    st.dataframe(explorer.resolve_points(picked, players).sort_values(y_stat, ascending=False).head(500),
+                 hide_index=True, use_container_width=True)
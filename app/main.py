@@ -1,5 +1,6 @@
 import streamlit as st
 import utils.data_loader as data_loader_experimental
+import utils.memory as memory
 # Set Streamlit page configuration (optional)
 st.set_page_config(page_title="FFB Research", page_icon="📊", layout="wide")
 
@@ -9,9 +10,20 @@ pages = [
     st.Page("custom_scoring.py", title="Custom Scoring"),
     st.Page("player_details.py", title="Player Details"),
     st.Page("player_comparison.py", title="Compare Players"),
+    st.Page("team_usage.py", title="Team Usage"),
+    st.Page("defense_vs_position.py", title="Defense vs Position"),
+    st.Page("draft_board.py", title="Draft Board"),
+    st.Page("matchup_simulator.py", title="Matchup Simulator"),
+    st.Page("history.py", title="All-Time Leaders"),
+    st.Page("kpi_explorer.py", title="KPI Explorer"),
+    st.Page("memory_usage.py", title="Memory Usage"),
 
 ]
 
 pg = st.navigation(pages, expanded=False)
 pg.run()
 
+# Once the page has rendered, release idle pages and warm what the user is likely to open next
+memory.sweep_idle()
+data_loader_experimental.prefetch_neighbours()
+
@@ -0,0 +1,70 @@
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+import components.selectas as selectas
+import utils.data_loader as data_loader
+import utils.memory as memory
+import utils.simulation as simulation
+
+st.title("Matchup Simulator")
+
+if "matchup_simulator" not in st.session_state:
+    data_loader.init_state("matchup_simulator")
+data_loader.sync_data_version("matchup_simulator")
+memory.track_page("matchup_simulator")
+
+selector_cols = st.columns(3)
+with selector_cols[0]:
+    selectas.format_selector("matchup_simulator")
+with selector_cols[1]:
+    selectas.week_selector("matchup_simulator")
+with selector_cols[2]:
+    selectas.year_selector("matchup_simulator")
+
+state = st.session_state.matchup_simulator
+week_range = range(state["selected_weeks"][0], state["selected_weeks"][1] + 1)
+sample_data = state["full_data"].loc[state["full_data"]["week"].isin(week_range)]
+all_players = sorted(sample_data["player_display_name"].unique())
+
+lineup_cols = st.columns(2)
+with lineup_cols[0]:
+    lineup_a = st.multiselect("Your Lineup", all_players, max_selections=15, key="sim_lineup_a")
+with lineup_cols[1]:
+    lineup_b = st.multiselect("Opponent Lineup", all_players, max_selections=15, key="sim_lineup_b")
+
+option_cols = st.columns(3)
+with option_cols[0]:
+    n_trials = st.select_slider("Trials", options=[10_000, 50_000, 100_000, 250_000, 500_000, 1_000_000],
+                                value=100_000)
+with option_cols[1]:
+    n_weeks = st.number_input("Rest-of-Season Weeks", min_value=1, max_value=18, value=8, step=1)
+with option_cols[2]:
+    seed = st.number_input("Seed", min_value=0, value=0, step=1)
+
+st.caption("Each trial draws every player's weekly score from their games in the selected weeks.")
+
+if st.button("Run Simulation", disabled=not lineup_a):
+    with st.spinner("Simulating ..."):
+        if lineup_b:
+            matchup = simulation.simulate_matchup(sample_data, lineup_a, lineup_b, n_trials, seed)
+            result_cols = st.columns(3)
+            result_cols[0].metric("Win Probability", f"{matchup['win_prob_a']:.1%}")
+            result_cols[1].metric("Your Median", round(float(np.median(matchup["totals_a"])), 1))
+            result_cols[2].metric("Opponent Median", round(float(np.median(matchup["totals_b"])), 1))
+
+            # Bin server-side so the chart payload does not grow with the trial count
+            counts, edges = np.histogram(matchup["totals_a"] - matchup["totals_b"], bins=60)
+            fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts / counts.sum(),
+                                   marker=dict(color="#FFD700")))
+            fig.add_vline(x=0, line=dict(color="rgba(255,255,255,0.5)", dash="dash"))
+            fig.update_layout(height=300, margin=dict(l=20, r=20, t=20, b=20), xaxis_title="Margin",
+                              yaxis_title="Share of Trials", template="plotly_dark")
+            st.plotly_chart(fig, use_container_width=True)
+
+        rest_of_season = simulation.simulate_rest_of_season(sample_data, lineup_a, n_weeks, n_trials, seed)
+        st.subheader(f"Your Lineup Over the Next {n_weeks} Weeks")
+        pct_cols = st.columns(5)
+        for col, (pct, points) in zip(pct_cols, rest_of_season["percentiles"].items()):
+            col.metric(f"P{pct}", round(points, 1))
+        st.dataframe(rest_of_season["by_player"].round(1), hide_index=True, use_container_width=True)
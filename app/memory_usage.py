@@ -0,0 +1,44 @@
+import streamlit as st
+
+import utils.memory as memory
+import utils.prefetch as prefetch
+
+st.title("Memory Usage")
+st.caption(f"Page tables are evicted after {memory.IDLE_TIMEOUT_S // 60} idle minutes or when a session "
+           f"exceeds {memory.SESSION_BUDGET_BYTES // 1024 ** 2} MB, and rebuilt on return.")
+
+report = memory.memory_report()
+if report.empty:
+    st.info("No pages have been visited yet.")
+else:
+    live = report.loc[~report["evicted"]]
+    cols = st.columns(3)
+    cols[0].metric("Process Total (MB)", round(live["mb"].sum(), 1))
+    cols[1].metric("Sessions", report["session"].nunique())
+    cols[2].metric("Evicted Pages", int(report["evicted"].sum()))
+
+    st.subheader("By Session")
+    st.dataframe(report.groupby("session", as_index=False)["mb"].sum().sort_values("mb", ascending=False),
+                 hide_index=True, use_container_width=True)
+
+    st.subheader("By Page")
+    st.dataframe(report.sort_values("mb", ascending=False).round(2), hide_index=True, use_container_width=True)
+
+st.subheader("Background Prefetch")
+prefetcher = prefetch.prefetcher()
+status = prefetcher.status()
+st.caption(f"Adjacent seasons and other saved formats are warmed after each page renders, "
+           f"up to {prefetcher.budget_bytes // 1024 ** 2} MB.")
+if status.empty:
+    st.info("Nothing prefetched yet.")
+else:
+    st.dataframe(status.round(2), hide_index=True, use_container_width=True)
+# Only this session's prefetching is switched; other visitors keep theirs
+session = memory.session_id()
+was_enabled = session not in prefetcher.disabled_sessions
+enabled = st.toggle("Prefetch in the background for this session", value=was_enabled)
+if enabled and not was_enabled:
+    prefetcher.disabled_sessions.discard(session)
+elif was_enabled and not enabled:
+    prefetcher.disabled_sessions.add(session)
+    prefetcher.cancel(session)
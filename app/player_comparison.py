@@ -5,16 +5,19 @@ import components.kpi as kpi
 import components.visualizations as viz
 import utils.data_loader as data_loader_experimental
 import components.selectas as selectas
+import utils.memory as memory
 
 if "player_comparison" not in st.session_state:
     data_loader_experimental.init_state("player_comparison", default_players=[
     {"name": "Aaron Rodgers", "position": "QB"},
     {"name": "Sam Darnold", "position": "QB"}
 ])
+data_loader_experimental.sync_data_version("player_comparison")
+memory.track_page("player_comparison")
 
 selector_container = st.container()
 with selector_container:
-    selector_cols = st.columns(3)
+    selector_cols = st.columns(4)
     with selector_cols[0]:
         selectas.format_selector("player_comparison")
 
@@ -24,6 +27,9 @@ with selector_container:
     with selector_cols[2]:
         selectas.year_selector("player_comparison")
 
+    with selector_cols[3]:
+        selectas.min_games_selector("player_comparison")
+
 comparison_columns = st.columns([1,2,1])
 
 
@@ -5,7 +5,9 @@ import utils.scoring as scoring
 import components.visualizations as viz
 import utils.data_loader as data_loader
 import components.selectas as selectas
+import utils.memory as memory
 import components.kpi as kpi
+import components.similar_players as similar_players
 
 
 
@@ -15,6 +17,8 @@ if "player_details" not in st.session_state:
     data_loader.init_state("player_details", default_players=[
         {"name": "Olamide Zaccheaus", "position": "WR"},
     ])
+data_loader.sync_data_version("player_details")
+memory.track_page("player_details")
 
 player_data = st.session_state.player_details["players"][0]["tables"]["player_data"]
 team = player_data.sort_values("week", ascending=False)['recent_team'].iloc[0]
@@ -43,9 +47,17 @@ with container1:
         selectas.format_selector("player_details")
         selectas.year_selector("player_details")
         selectas.week_selector("player_details")
+        selectas.min_games_selector("player_details")
 
 scoring_kpis_container = st.container(border=False)
 with scoring_kpis_container:
     kpi.player_kpis("player_details")
 
+with st.expander("Opponent-Adjusted Averages"):
+    kpi.opponent_adjusted_table("player_details")
+
+similar_players.similar_players("player_details")
+
+viz.trend_chart("player_details")
+
 viz.custom_bar("player_details")
\ No newline at end of file
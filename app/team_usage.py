@@ -0,0 +1,60 @@
+import plotly.graph_objects as go
+import streamlit as st
+
+import components.selectas as selectas
+import utils.data_loader as data_loader
+import utils.memory as memory
+import utils.usage as usage
+
+st.title("Team Usage")
+
+if "team_usage" not in st.session_state:
+    data_loader.init_state("team_usage")
+data_loader.sync_data_version("team_usage")
+memory.track_page("team_usage")
+
+state = st.session_state.team_usage
+scoring_format = state["selected_scoring_format"]
+team_usage = data_loader.load_team_usage(state["selected_year"], state["data_version"], scoring_format,
+                                         scoring_format.cache_key(), state["stat_mapping"])
+
+selector_cols = st.columns(4)
+with selector_cols[0]:
+    team = st.selectbox("Team", sorted(team_usage["recent_team"].dropna().unique()), key="usage_team")
+with selector_cols[1]:
+    selectas.format_selector("team_usage")
+with selector_cols[2]:
+    selectas.week_selector("team_usage")
+with selector_cols[3]:
+    selectas.year_selector("team_usage")
+
+# Shares were computed for every team at once; the view only slices one team out
+team_weeks = team_usage.loc[team_usage["recent_team"] == team]
+shares = usage.team_window_shares(team_weeks, state["selected_weeks"])
+share_columns = [c for c in shares.columns if c.endswith("Share")]
+
+st.subheader("Depth Chart Shares")
+position_order = {"QB": 0, "RB": 1, "WR": 2, "TE": 3}
+shares = shares.assign(order=shares["position"].map(position_order).fillna(9)).sort_values(
+    ["order", "Points Share"], ascending=[True, False]).drop(columns="order")
+st.dataframe(
+    shares.rename(columns={"player_display_name": "Player", "position": "Pos"}),
+    hide_index=True, use_container_width=True,
+    column_config={c: st.column_config.ProgressColumn(c, format="%.2f", min_value=0.0, max_value=1.0)
+                   for c in share_columns},
+)
+
+st.subheader("Weekly Shares")
+stat = st.selectbox("Stat", [s for s in usage.USAGE_STATS if f"{s}_team_share" in team_weeks.columns],
+                    format_func=lambda s: usage.USAGE_STATS[s])
+window = team_weeks.loc[team_weeks["week"].between(*state["selected_weeks"])]
+top_players = shares.sort_values(usage.USAGE_STATS[stat], ascending=False)["player_display_name"].head(8)
+
+fig = go.Figure()
+for name in top_players:
+    player_weeks = window.loc[window["player_display_name"] == name]
+    fig.add_trace(go.Bar(x=player_weeks["week"], y=player_weeks[f"{stat}_team_share"], name=name))
+fig.update_layout(barmode="stack", height=350, margin=dict(l=20, r=20, t=20, b=20), yaxis_tickformat=".0%",
+                  legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5),
+                  template="plotly_dark")
+st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,175 @@
+"""
+Optional SQL engine over the local season store for all-history questions (career totals,
+best stretches since 2010) that would otherwise load every season into pandas.
+Requires the `duckdb` package (the `analytics` extra).
+
+DuckDB scans the stored Parquet files in place: only the columns a query names are read,
+row groups outside a season/position filter are skipped from their statistics, scans run
+on every core, and memory is capped with spilling to disk beyond the cap.
+"""
+import os
+
+import pandas as pd
+
+import utils.refresh as refresh
+import utils.scoring as scoring
+import utils.season_store as season_store
+from utils.scoring_rules import BonusRule, TierRule, PositionPremiumRule
+
+MEMORY_LIMIT = os.environ.get("FFB_DUCKDB_MEMORY_LIMIT", "1GB")
+# Counting stats that add up across games; rates and shares are left out of career totals
+CAREER_STATS = [
+    'completions', 'attempts', 'passing_yards', 'passing_tds', 'interceptions',
+    'carries', 'rushing_yards', 'rushing_tds',
+    'targets', 'receptions', 'receiving_yards', 'receiving_tds',
+]
+
+
+def available() -> bool:
+    try:
+        import duckdb  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def connect(threads: int = None, memory_limit: str = MEMORY_LIMIT):
+    """
+    Opens an in-memory DuckDB connection with a `weekly` view over every stored season.
+    """
+    try:
+        import duckdb
+    except ImportError as e:
+        raise ImportError("The analytic engine needs duckdb: poetry install -E analytics") from e
+
+    con = duckdb.connect()
+    con.execute(f"SET threads = {int(threads or os.cpu_count() or 1)}")
+    con.execute(f"SET memory_limit = '{memory_limit}'")
+    con.execute(f"SET temp_directory = '{season_store.STORE_ROOT / 'duckdb_tmp'}'")
+    files = [str(season_store.season_path(refresh.WEEKLY_DATASET, year))
+             for year in season_store.stored_seasons(refresh.WEEKLY_DATASET)]
+    if not files:
+        raise FileNotFoundError("No seasons in the local store yet; load or refresh a season first.")
+    con.execute(f"CREATE VIEW weekly AS SELECT * FROM read_parquet({files!r}, union_by_name = true)")
+    return con
+
+
+def _col(column: str) -> str:
+    return f'COALESCE(CAST("{column}" AS DOUBLE), 0)'
+
+
+def _positions(positions: tuple) -> str:
+    return ", ".join(f"'{p}'" for p in positions)
+
+
+def columns(con) -> set:
+    return set(con.execute("SELECT column_name FROM (DESCRIBE weekly)").df()['column_name'])
+
+
+def fantasy_points_sql(scoring_format, stat_mapping: dict, available_columns: set) -> str:
+    """
+    A SQL expression scoring one weekly row exactly as scoring.calculate_fantasy_points_vec
+    does, non-linear rules included, so per-game bonuses stay correct once rows are summed.
+    Columns missing from the store score 0, as in the pandas path.
+    """
+    compiled = scoring.compile_scoring(scoring_format, tuple(stat_mapping.items()))
+    terms = [f"{_col(column)} * {weight!r}" for column, weight in compiled.weights.items()
+             if weight and column in available_columns]
+
+    for rule in compiled.rules:
+        if rule.column not in available_columns:
+            continue
+        if isinstance(rule, BonusRule):
+            terms.append(f"CASE WHEN {_col(rule.column)} >= {rule.threshold!r} THEN {rule.points!r} ELSE 0 END")
+        elif isinstance(rule, TierRule):
+            cases = " ".join(f"WHEN {_col(rule.column)} >= {t!r} THEN {p!r}" for t, p in rule.tiers[::-1])
+            terms.append(f"CASE {cases} ELSE 0 END")
+        elif isinstance(rule, PositionPremiumRule):
+            terms.append(f"CASE WHEN position IN ({_positions(rule.positions)}) "
+                         f"THEN {_col(rule.column)} * {rule.per_unit!r} ELSE 0 END")
+
+    points = f"({' + '.join(terms) or '0'})"
+    for rule in compiled.multipliers:
+        points += f" * CASE WHEN position IN ({_positions(rule.positions)}) THEN {rule.multiplier!r} ELSE 1 END"
+    return points
+
+
+def _filters(since: int = None, until: int = None, position: str = None) -> str:
+    """Regular-season rows only, as in draft.format_totals, so playoff games never count."""
+    clauses = ["season_type = 'REG'"]
+    if since is not None:
+        clauses.append(f"season >= {int(since)}")
+    if until is not None:
+        clauses.append(f"season <= {int(until)}")
+    if position is not None:
+        clauses.append(f"position = '{position}'")
+    return " AND ".join(clauses)
+
+
+def career_totals(scoring_format, stat_mapping: dict, stats: list, since: int = None, until: int = None,
+                  position: str = None, con=None) -> pd.DataFrame:
+    """
+    Career totals of `stats` and calc_fantasy_points per player over a season range.
+
+    Returns:
+        pd.DataFrame: One row per player with player_display_name, position, seasons, games,
+        each stat summed, and calc_fantasy_points — ready for scoring.make_position_ranks.
+    """
+    con = con or connect()
+    available_columns = columns(con)
+    sums = "".join(f'SUM({_col(s)}) AS "{s}", ' for s in stats if s in available_columns)
+    return con.execute(f"""
+        SELECT player_id,
+               arg_max(player_display_name, season) AS player_display_name,
+               arg_max(position, season) AS position,
+               COUNT(DISTINCT season) AS seasons,
+               COUNT(*) AS games,
+               {sums}
+               ROUND(SUM({fantasy_points_sql(scoring_format, stat_mapping, available_columns)}), 2) AS calc_fantasy_points
+        FROM weekly
+        WHERE {_filters(since, until, position)}
+        GROUP BY player_id
+        ORDER BY calc_fantasy_points DESC
+    """).df()
+
+
+def best_stretches(scoring_format, stat_mapping: dict, weeks: int = 10, since: int = None,
+                   until: int = None, position: str = None, limit: int = 50, con=None) -> pd.DataFrame:
+    """
+    Each player's best run of `weeks` consecutive games within a season, by fantasy points.
+
+    Returns:
+        pd.DataFrame: The top `limit` stretches with player, position, season, first/last week
+        and the stretch's calc_fantasy_points.
+    """
+    con = con or connect()
+    return con.execute(f"""
+        WITH scored AS (
+            SELECT player_id, player_display_name, position, season, week,
+                   {fantasy_points_sql(scoring_format, stat_mapping, columns(con))} AS points
+            FROM weekly
+            WHERE {_filters(since, until, position)}
+        ), windows AS (
+            SELECT *,
+                   SUM(points) OVER w AS stretch_points,
+                   COUNT(*) OVER w AS stretch_games,
+                   MIN(week) OVER w AS first_week
+            FROM scored
+            WINDOW w AS (PARTITION BY player_id, season ORDER BY week
+                         ROWS BETWEEN {int(weeks) - 1} PRECEDING AND CURRENT ROW)
+        )
+        SELECT player_display_name, position, season, first_week, week AS last_week,
+               ROUND(stretch_points, 2) AS calc_fantasy_points
+        FROM windows
+        WHERE stretch_games = {int(weeks)}
+        QUALIFY ROW_NUMBER() OVER (PARTITION BY player_id ORDER BY stretch_points DESC) = 1
+        ORDER BY calc_fantasy_points DESC
+        LIMIT {int(limit)}
+    """).df()
+
+
+def query(sql: str, con=None) -> pd.DataFrame:
+    """
+    Runs arbitrary SQL against the `weekly` view and returns a pandas frame.
+    """
+    return (con or connect()).execute(sql).df()
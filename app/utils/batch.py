@@ -0,0 +1,144 @@
+import argparse
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import pandas as pd
+
+import utils.refresh as refresh
+import utils.scoring as scoring
+import utils.season_store as season_store
+import utils.standings as standings
+from utils.scoring import StandardScoringFormat, PPRScoringFormat
+
+DEFAULT_OUTPUT_DIR = season_store.STORE_ROOT / "batch"
+TABLES = ["scored", "totals", "averages", "ranks_totals", "ranks_averages"]
+KEY_COLUMNS = ["season", "week"]  # Numeric labels, not stats: never summed or averaged
+
+
+def format_slug(scoring_format: scoring.ScoringFormat) -> str:
+    """
+    Filesystem-safe partition value for a scoring format name.
+    """
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", scoring_format.name).strip("_") or "format"
+
+
+def format_slugs(scoring_formats: list) -> list:
+    """
+    format_slug of each format, in order.
+
+    Raises:
+        ValueError: If two different formats share a slug, as their partitions would overwrite each other.
+    """
+    seen = {}
+    for scoring_format in scoring_formats:
+        slug = format_slug(scoring_format)
+        if slug in seen and seen[slug] != scoring_format:
+            raise ValueError(f"Scoring formats '{seen[slug].name}' and '{scoring_format.name}' both write to "
+                             f"format={slug}; rename one of them.")
+        seen.setdefault(slug, scoring_format)
+    return [format_slug(scoring_format) for scoring_format in scoring_formats]
+
+
+def position_ranks(scored: pd.DataFrame, window: str, min_games: int = standings.MIN_GAMES) -> pd.DataFrame:
+    """
+    Dense ranks of every stat within each position, as shown on the KPI cards.
+
+    Args:
+        scored (pd.DataFrame): Scored weekly rows.
+        window (str): "totals" or "averages".
+        min_games (int): Games needed to qualify for the rank pool.
+    """
+    ranked = []
+    for position, positional_data in scored.groupby("position", sort=True):
+        ranks = standings.position_standings(positional_data, min_games)[window]["ranks"]
+        ranks["position"] = position
+        ranked.append(ranks)
+    return pd.concat(ranked, ignore_index=True)
+
+
+def score_season_tables(weekly: pd.DataFrame, scoring_format: scoring.ScoringFormat,
+                        stat_mapping: dict = None) -> dict:
+    """
+    Computes every batch table for one season and format.
+
+    Returns:
+        dict: {table name: DataFrame} for each name in TABLES.
+    """
+    stat_mapping = stat_mapping or scoring.stat_mapping_nfl_py
+    scored = scoring.calculate_fantasy_points_vec(weekly.copy(), scoring_format, stat_mapping)
+    stats = scored.drop(columns=KEY_COLUMNS, errors="ignore")
+    return {
+        "scored": scored,
+        "totals": scoring.calculate_total_stats(stats),
+        "averages": scoring.calculate_avg_stats(stats),
+        "ranks_totals": position_ranks(stats, "totals"),
+        "ranks_averages": position_ranks(stats, "averages"),
+    }
+
+
+def score_season(year: int, scoring_formats: list, output_dir) -> list:
+    """
+    Scores one season under every format and writes each table to
+    {output_dir}/{table}/season={year}/format={slug}/part-0.parquet, so Hive-partitioned
+    readers recover both season and format. The in-file season column is dropped, since
+    the partition supplies it. Runs in a worker process.
+
+    Returns:
+        list: Paths of the written files.
+    """
+    weekly = refresh.ensure_weekly_season(year)
+
+    written = []
+    for scoring_format, slug in zip(scoring_formats, format_slugs(scoring_formats)):
+        for table_name, table in score_season_tables(weekly, scoring_format).items():
+            path = Path(output_dir) / table_name / f"season={year}" / f"format={slug}" / "part-0.parquet"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            table.drop(columns="season", errors="ignore").to_parquet(path, index=False)
+            written.append(path)
+    return written
+
+
+def run_batch(years, scoring_formats: list, output_dir=DEFAULT_OUTPUT_DIR, max_workers: int = None) -> list:
+    """
+    Scores every season in `years` under every format, one season per worker process.
+
+    Args:
+        years: Iterable of seasons.
+        scoring_formats (list): ScoringFormat instances.
+        output_dir: Root directory of the partitioned Parquet output.
+        max_workers (int): Process pool size. Defaults to the CPU count.
+
+    Returns:
+        list: Paths of every written file.
+    """
+    years = list(years)
+    if not years:
+        return []
+    format_slugs(scoring_formats)  # Fails before any worker starts
+    max_workers = min(max_workers or os.cpu_count() or 1, len(years))
+    written = []
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(score_season, year, scoring_formats, output_dir): year for year in years}
+        for future in as_completed(futures):
+            paths = future.result()
+            print(f"{futures[future]}: wrote {len(paths)} files")
+            written.extend(paths)
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score seasons under every saved scoring format.")
+    parser.add_argument("--start", type=int, default=1999)
+    parser.add_argument("--end", type=int, default=2024, help="Last season, inclusive.")
+    parser.add_argument("--formats", default=None,
+                        help="JSON file of extra formats (the Custom Scoring page's export).")
+    parser.add_argument("--output-dir", default=str(DEFAULT_OUTPUT_DIR))
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    formats = [StandardScoringFormat(), PPRScoringFormat()]
+    if args.formats:
+        formats += [f for f in scoring.load_scoring_formats(args.formats) if f not in formats]
+    run_batch(range(args.start, args.end + 1), formats, args.output_dir, args.workers)
@@ -1,13 +1,31 @@
 import pandas as pd
 import streamlit as st
-import nfl_data_py as nfl
 import utils.scoring as scoring
+import utils.analytics as analytics
+import utils.draft as draft
+import utils.explorer as explorer
+import utils.matchups as matchups
+import utils.memory as memory
+import utils.metrics as metrics
+import utils.pbp as pbp
+import utils.prefetch as prefetch
+import utils.refresh as refresh
+import utils.season_store as season_store
+import utils.similarity as similarity
+import utils.standings as standings
+import utils.usage as usage
 from utils.scoring import StandardScoringFormat, PPRScoringFormat
 import copy
+import threading
+from collections import OrderedDict
 
 
 @st.cache_data(show_spinner="Loading data ...")
-def load_data(years):
+def load_data(years, version=None):
+    """
+    Loads weekly data from the local season store, downloading any season that has not been
+    stored yet. `version` is only part of the cache key, so a refreshed season is re-read.
+    """
     if years is None:
         print('No year(s) selected!?')
         return
@@ -16,7 +34,198 @@ def load_data(years):
     else:
         year_range = [years]
 
-    return nfl.import_weekly_data(year_range, downcast=True)
+    frames = [refresh.ensure_weekly_season(year) for year in year_range]
+    return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+
+def season_version(year):
+    """
+    Returns the stored version of a season, downloading it into the store on first use.
+    If a background prefetch is already downloading it, that download is awaited instead
+    (see refresh.season_lock).
+    """
+    version = refresh.data_version(year)
+    if version == 0:
+        with st.spinner("Downloading season ..."):
+            refresh.ensure_weekly_season(year)
+        version = refresh.data_version(year)
+    return version
+
+
+@st.cache_data(show_spinner=False)
+def load_pbp_usage(year):
+    """
+    Reads the play-by-play usage metrics for a season from the local store.
+    Returns None if the season has not been ingested (see utils/pbp.py).
+    """
+    return season_store.read_season(pbp.PBP_DATASET, year)
+
+
+def load_weekly_with_usage(year):
+    """
+    Weekly data for a season, left-joined with any ingested play-by-play usage metrics.
+    """
+    return pbp.join_usage(load_data(year, season_version(year)), load_pbp_usage(year))
+
+
+@st.cache_resource(show_spinner="Scoring season ...", max_entries=8)
+def load_scored_season(year, version, _scoring_format, format_key, stat_mapping):
+    """
+    The scored season for one (season, version, format), shared by every page and session
+    instead of each scoring its own copy. A matching prefetched season is taken as is.
+    Callers must not modify the returned frame.
+
+    Args:
+        format_key (str): _scoring_format.cache_key(); keys the cache in place of the format.
+    """
+    scored = prefetch.prefetcher().take(prefetch.season_key(year, _scoring_format, stat_mapping), version, "scored")
+    if scored is None:
+        scored = scoring.calculate_fantasy_points_vec(load_weekly_with_usage(year), _scoring_format, stat_mapping)
+    return scored
+
+
+TREND_CACHE_BUDGET_BYTES = 384 * 1024 ** 2  # Least recently used trend frames are dropped beyond this
+
+
+@st.cache_resource
+def _trend_cache():
+    """
+    Process-wide {(year, scoring_format, stat_mapping): (data_version, trend_frame, bytes)},
+    least recently used first. Shared by every session, so entries are replaced and never
+    mutated in place.
+    """
+    return {"lock": threading.Lock(), "entries": OrderedDict()}
+
+
+def _store_trends(key, version, trends):
+    cache = _trend_cache()
+    with cache["lock"]:
+        entries = cache["entries"]
+        entries[key] = (version, trends, memory.deep_size(trends))
+        entries.move_to_end(key)
+        while len(entries) > 1 and sum(entry[2] for entry in entries.values()) > TREND_CACHE_BUDGET_BYTES:
+            entries.popitem(last=False)
+
+
+def load_trend_metrics(year, scoring_format, stat_mapping):
+    """
+    Scores a season and computes the rolling, EWMA, week-over-week, running-total and
+    boom/bust columns for every player at once. Cached per (season, format); after an
+    in-season refresh only the players in the changed weeks are recomputed.
+    """
+    version = season_version(year)
+    key = (year, scoring_format, tuple(stat_mapping.items()))
+    cache = _trend_cache()
+    with cache["lock"]:
+        cached = cache["entries"].get(key)
+        if cached is not None:
+            cache["entries"].move_to_end(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    changed_weeks = refresh.changed_weeks_since(year, cached[0]) if cached is not None else None
+    if changed_weeks is None:
+        trends = prefetch.prefetcher().take(key, version, "trends")
+        if trends is None:
+            trends = metrics.add_trend_columns(
+                load_scored_season(year, version, scoring_format, scoring_format.cache_key(), stat_mapping))
+    else:
+        weekly = load_weekly_with_usage(year)
+        new_rows = weekly.loc[weekly["week"].isin(changed_weeks)].copy()
+        trends = metrics.update_trend_columns(
+            cached[1], scoring.calculate_fantasy_points_vec(new_rows, scoring_format, stat_mapping), changed_weeks)
+    _store_trends(key, version, trends)
+    return trends
+
+@st.cache_resource(show_spinner="Building similarity index ...", max_entries=16)
+def load_similarity_index(years, versions, _scoring_format, format_key, stat_mapping, position, stats):
+    """
+    Builds the per-game similarity index for a position over a range of seasons. Seasons are
+    read straight from the store one at a time and reduced to profiles, so only the small
+    profile table is kept. Cached per (seasons, versions, format, position, stats) as a shared
+    resource, so the matrix is not copied on every query; callers must not modify it.
+
+    Args:
+        years (tuple): Seasons to include.
+        versions (tuple): season_version of each year, so a refreshed season rebuilds the index.
+        format_key (str): _scoring_format.cache_key(); keys the cache in place of the format.
+        stats (tuple): Stat columns of the profile, e.g. the position's KPIs.
+    """
+    profiles = []
+    for year in years:
+        scored = scoring.calculate_fantasy_points_vec(
+            season_store.read_season(refresh.WEEKLY_DATASET, year), _scoring_format, stat_mapping)
+        profiles.append(similarity.season_profiles(scored, position, list(stats)))
+    return similarity.SimilarityIndex(pd.concat(profiles, ignore_index=True), stats)
+
+
+@st.cache_data(show_spinner="Scoring every format ...")
+def load_format_totals(year, version, _scoring_formats, format_keys, stat_mapping):
+    """
+    Season point totals under every format plus, per format and position, the totals sorted
+    high to low. League settings only feed lookups into these arrays, so they never rescore.
+    `version` keys the cache to the stored season version and `format_keys` (each format's
+    cache_key(), in order) to the formats.
+    """
+    totals = draft.format_totals(load_weekly_with_usage(year), list(_scoring_formats), stat_mapping)
+    return totals, draft.sorted_points(totals, [f.name for f in _scoring_formats])
+
+
+@st.cache_data(show_spinner="Building defense tables ...")
+def load_defense_prefix(year, version, _scoring_format, format_key, stat_mapping):
+    """
+    Week-prefix sums of what every defense allowed to every position, for one season and
+    format. Week windows are then sliced out of it without regrouping (see utils/matchups.py).
+    `version` keys the cache to the stored season version and `format_key` (the format's
+    cache_key()) to the format. Built from the shared load_scored_season.
+    """
+    return matchups.DefensePrefix(load_scored_season(year, version, _scoring_format, format_key, stat_mapping))
+
+
+@st.cache_data(show_spinner="Computing team usage ...")
+def load_team_usage(year, version, _scoring_format, format_key, stat_mapping):
+    """
+    The scored season with every player's weekly share of their team's targets, carries,
+    air yards and points. Computed once per (season, version, format) from the shared
+    load_scored_season; `format_key` is the format's cache_key().
+    """
+    return usage.add_team_shares(load_scored_season(year, version, _scoring_format, format_key, stat_mapping))
+
+
+def store_versions():
+    """
+    ((year, version), ...) for every stored season; keys caches of all-history queries.
+    """
+    return tuple((year, refresh.data_version(year)) for year in season_store.stored_seasons(refresh.WEEKLY_DATASET))
+
+
+@st.cache_data(show_spinner="Querying every stored season ...")
+def load_career_totals(versions, _scoring_format, format_key, stat_mapping, stats, since, until, position):
+    """
+    Career totals from the DuckDB engine (see utils/analytics.py). `versions` is store_versions()
+    and `format_key` the format's cache_key().
+    """
+    return analytics.career_totals(_scoring_format, stat_mapping, list(stats), since, until, position)
+
+
+@st.cache_data(show_spinner="Querying every stored season ...")
+def load_best_stretches(versions, _scoring_format, format_key, stat_mapping, weeks, since, until, position):
+    """
+    Best N-game stretches from the DuckDB engine (see utils/analytics.py). `versions` is store_versions()
+    and `format_key` the format's cache_key().
+    """
+    return analytics.best_stretches(_scoring_format, stat_mapping, weeks, since, until, position)
+
+
+@st.cache_data(show_spinner="Loading every stored season ...")
+def load_explorer_population(versions, _scoring_format, format_key, stat_mapping, stats, level):
+    """
+    The KPI explorer's points and player index over every stored season (see utils/explorer.py).
+    `versions` is store_versions() and `format_key` the format's cache_key().
+    """
+    return explorer.load_population([year for year, _ in versions], list(stats), _scoring_format, stat_mapping,
+                                    level)
+
 
 def setup_state_main():
     """
@@ -37,6 +246,9 @@ COMMON_STATE_TEMPLATE = {
     "stat_mapping": scoring.stat_mapping_nfl_py,
     "players": [],
     "full_data": None,  # Updated separately.
+    "data_version": 0,  # Stored season version full_data was built from.
+    "min_games": standings.MIN_GAMES,  # Games needed to qualify for rank/percentile pools
+    "rank_cache": {},  # {(position, selected_weeks, min_games): standings.position_standings(...)}
 }
 
 PLAYER_STATE_TEMPLATE = {
@@ -81,12 +293,56 @@ def update_full_data(page_key: str):
     """
     state = getattr(st.session_state, page_key)
 
-    state["full_data"] = scoring.calculate_fantasy_points_vec(
-        load_data(state["selected_year"]),
+    version = season_version(state["selected_year"])
+    scoring_format = state["selected_scoring_format"]
+    state["full_data"] = load_scored_season(state["selected_year"], version, scoring_format,
+                                            scoring_format.cache_key(), state["stat_mapping"])
+    state["data_version"] = version
+    state["rank_cache"] = {}
+    # Optional: reassign the updated state back to session_state for clarity.
+    setattr(st.session_state, page_key, state)
+    update_player_tables(page_key)
+
+
+def sync_data_version(page_key: str):
+    """
+    Brings a page's 'full_data' up to the latest stored version of its season. Run on every
+    page render so open sessions pick up an in-season refresh (utils/refresh.py) without a
+    restart: only the rows of the changed weeks are rescored and spliced in, and only the
+    rank cache entries whose week window overlaps those weeks are dropped. Pages whose
+    tables were evicted by utils.memory are rebuilt here.
+
+    Args:
+        page_key (str): The key to identify the page's state.
+    """
+    state = getattr(st.session_state, page_key)
+    if state["full_data"] is None:  # Evicted while the user was on another page
+        update_full_data(page_key)
+        return
+
+    current_version = season_version(state["selected_year"])
+    if state["data_version"] == current_version:
+        return
+
+    changed_weeks = refresh.changed_weeks_since(state["selected_year"], state["data_version"])
+    if changed_weeks is None or not state["players"]:  # Pages without players keep the shared season
+        update_full_data(page_key)
+        return
+
+    weekly = load_weekly_with_usage(state["selected_year"])
+    new_rows = scoring.calculate_fantasy_points_vec(
+        weekly.loc[weekly["week"].isin(changed_weeks)].copy(),
         state["selected_scoring_format"],
         state["stat_mapping"]
     )
-    # Optional: reassign the updated state back to session_state for clarity.
+    full_data = state["full_data"]
+    state["full_data"] = pd.concat([full_data.loc[~full_data["week"].isin(changed_weeks)], new_rows],
+                                   ignore_index=True)
+    state["data_version"] = current_version
+    state["rank_cache"] = {
+        rank_key: position_standings for rank_key, position_standings in state["rank_cache"].items()
+        if not any(rank_key[1][0] <= week <= rank_key[1][1] for week in changed_weeks)
+    }
     setattr(st.session_state, page_key, state)
     update_player_tables(page_key)
 
@@ -94,14 +350,22 @@ def update_full_data(page_key: str):
 def update_player_tables(page_key:str):
     """
     Function to be run any time the tables relative to a specific player need to be initialized or overwritten.
-    These tables include 'player' and 'positional' tables
+    These tables include 'player' and 'positional' tables. Pages without players (the season-level
+    pages) only keep the shared full_data, so trends and defense tables are not built for them.
 
     :param page_key:
     :return:
     """
     state = getattr(st.session_state, page_key)
+    if not state["players"]:
+        return
     week_range = range(state["selected_weeks"][0], state["selected_weeks"][1] + 1)
+    trend_data = load_trend_metrics(state["selected_year"], state["selected_scoring_format"], state["stat_mapping"])
     full_data = state["full_data"].loc[state["full_data"]["week"].isin(week_range)]
+    scoring_format = state["selected_scoring_format"]
+    defense_allowed = load_defense_prefix(state["selected_year"], state["data_version"], scoring_format,
+                                          scoring_format.cache_key(), state["stat_mapping"]
+                                          ).window(state["selected_weeks"])
     for player in state["players"]:
 
         player_data = full_data.query(
@@ -118,19 +382,46 @@ def update_player_tables(page_key:str):
             st.warning(f"No positional data found for position: {player['position']}")
             return
 
+        rank_key = (player['position'], tuple(state["selected_weeks"]), state["min_games"])
+        if rank_key not in state["rank_cache"]:
+            state["rank_cache"][rank_key] = standings.position_standings(positional_data, state["min_games"])
+        position_standings = state["rank_cache"][rank_key]
+
+        player_trends = metrics.player_trend(trend_data, player['name'], state["selected_weeks"])
+
         player["tables"].update({
             "player_data": player_data,
+            "player_trends": player_trends,
+            "player_consistency": metrics.summarize_consistency(player_trends).iloc[0],
             "player_stat_totals": player_data.sum(numeric_only=True),
             "player_stat_averages": player_data.mean(numeric_only=True),
+            "player_stat_averages_adjusted": matchups.opponent_adjusted(player_data, defense_allowed).mean(
+                numeric_only=True),
             "player_points_by_stat": scoring.calculate_fantasy_points_by_category(
                 player_data, scoring_format=state["selected_scoring_format"], stat_mapping=state["stat_mapping"]
             ),
             "positional_data": positional_data,
-            "position_ranks_totals": scoring.make_position_ranks(scoring.calculate_total_stats(positional_data)),
-            "position_ranks_averages": scoring.make_position_ranks(scoring.calculate_avg_stats(positional_data))
+            "position_games": position_standings["games"],
+            "position_ranks_totals": position_standings["totals"]["ranks"],
+            "position_ranks_averages": position_standings["averages"]["ranks"],
+            "position_percentiles_totals": position_standings["totals"]["percentiles"],
+            "position_percentiles_averages": position_standings["averages"]["percentiles"],
+            "position_zscores_totals": position_standings["totals"]["zscores"],
+            "position_zscores_averages": position_standings["averages"]["zscores"],
         })
 
 
+def prefetch_neighbours():
+    """
+    Warms, in the background, the seasons and formats this session's open pages are most
+    likely to switch to next. Run once the page has rendered (see main.py).
+    """
+    page_states = [state for state in st.session_state.values()
+                   if isinstance(state, dict) and "selected_year" in state and state.get("full_data") is not None]
+    prefetch.prefetcher().schedule(
+        prefetch.warm_up_keys(page_states, st.session_state.scoring_formats), memory.session_id())
+
+
 # CALLBACKS
 
 def handle_change(page_key: str,
@@ -173,6 +464,13 @@ def handle_week_change(page_key: str):
     """
     handle_change(page_key, "selected_weeks", update_player_tables)
 
+def handle_min_games_change(page_key: str):
+    """
+    Callback function for when the user changes the minimum games to qualify for ranks.
+    Rank pools are cached per threshold, so only the player tables are refreshed.
+    """
+    handle_change(page_key, "min_games", update_player_tables)
+
 def handle_player_change(page_key: str,
                          player_index:int=0):
     """
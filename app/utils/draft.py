@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+import utils.scoring as scoring
+
+DRAFT_POSITIONS = ['QB', 'RB', 'WR', 'TE']
+FLEX_POSITIONS = ['RB', 'WR', 'TE']
+DEFAULT_SLOTS = {'QB': 1, 'RB': 2, 'WR': 2, 'TE': 1, 'FLEX': 1}
+
+
+def format_totals(weekly: pd.DataFrame, scoring_formats: list, stat_mapping: dict) -> pd.DataFrame:
+    """
+    Regular-season fantasy point totals for every player under every format. Each format's
+    weekly points come from its compiled scorer; all formats are then totalled in one groupby.
+    Postseason weeks are left out so playoff teams' players are not inflated.
+
+    Returns:
+        pd.DataFrame: One row per player with player_id, player_display_name, position,
+        recent_team, games, and one points column per format (named after the format).
+    """
+    weekly = weekly.loc[weekly['position'].isin(DRAFT_POSITIONS)]
+    if 'season_type' in weekly:
+        weekly = weekly.loc[weekly['season_type'] == 'REG']
+    names = [f.name for f in scoring_formats]
+    points = pd.DataFrame(
+        np.column_stack([scoring.compile_scoring(f, tuple(stat_mapping.items())).points(weekly)
+                         for f in scoring_formats]),
+        columns=names, index=weekly.index)
+
+    grouped = points.groupby(weekly['player_id'], sort=False)
+    totals = grouped.sum()
+    totals['games'] = grouped.size()
+    labels = weekly.groupby('player_id', sort=False)[['player_display_name', 'position', 'recent_team']].last()
+    return labels.join(totals).reset_index()
+
+
+def sorted_points(totals: pd.DataFrame, format_names: list) -> dict:
+    """
+    {format name: {position: points sorted high to low}} — the only input replacement-level
+    lookups need, so league settings can change without touching the player table.
+    """
+    by_position = totals.groupby('position')
+    return {
+        name: {position: -np.sort(-group[name].to_numpy()) for position, group in by_position}
+        for name in format_names
+    }
+
+
+def replacement_levels(sorted_by_position: dict, teams: int, slots: dict) -> dict:
+    """
+    Points of the best player left after every team fills its starting lineup.
+    FLEX spots go to the best remaining RB/WR/TE, moving those positions' lines deeper.
+
+    Args:
+        sorted_by_position (dict): {position: points sorted high to low} for one format.
+        teams (int): Teams in the league.
+        slots (dict): Starters per team by position, including 'FLEX'.
+
+    Returns:
+        dict: {position: replacement points}
+    """
+    starters = {position: teams * slots.get(position, 0) for position in DRAFT_POSITIONS}
+
+    flex_spots = teams * slots.get('FLEX', 0)
+    if flex_spots:
+        leftovers = [(sorted_by_position.get(p, np.empty(0))[starters[p]:], p) for p in FLEX_POSITIONS]
+        pool = np.concatenate([points for points, _ in leftovers])
+        owners = np.concatenate([np.full(len(points), p) for points, p in leftovers])
+        best = owners[np.argsort(-pool, kind='stable')[:flex_spots]]
+        for position in FLEX_POSITIONS:
+            starters[position] += int(np.count_nonzero(best == position))
+
+    levels = {}
+    for position in DRAFT_POSITIONS:
+        points = sorted_by_position.get(position, np.empty(0))
+        levels[position] = float(points[starters[position]]) if starters[position] < len(points) else 0.0
+    return levels
+
+
+def draft_board(totals: pd.DataFrame, sorted_by_format: dict, teams: int, slots: dict) -> pd.DataFrame:
+    """
+    Adds '{format} VORP' and '{format} Rank' columns for every format.
+
+    Returns:
+        pd.DataFrame: A copy of totals with value over replacement for each format.
+    """
+    board = totals.copy()
+    positions = board['position'].to_numpy()
+    for name, sorted_by_position in sorted_by_format.items():
+        levels = replacement_levels(sorted_by_position, teams, slots)
+        replacement = np.select([positions == p for p in DRAFT_POSITIONS],
+                                [levels[p] for p in DRAFT_POSITIONS], 0.0)
+        board[f"{name} VORP"] = board[name].to_numpy() - replacement
+        board[f"{name} Rank"] = board[f"{name} VORP"].rank(ascending=False, method='min').astype(int)
+    return board
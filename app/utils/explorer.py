@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+
+import utils.metrics as metrics
+import utils.refresh as refresh
+import utils.scoring as scoring
+import utils.season_store as season_store
+import utils.standings as standings
+
+EXPLORER_STATS = metrics.TREND_STATS
+LABEL_COLUMNS = ['player_id', 'player_display_name', 'position', 'season', 'week']
+MAX_POINTS = 20_000  # Above this many points in view, density bins are drawn instead
+BINS = 120  # Bins per axis when zoomed out
+
+
+def load_population(years: list, stats: list, scoring_format, stat_mapping: dict, level: str = "week",
+                    min_games: int = standings.MIN_GAMES) -> tuple:
+    """
+    Every player-week, or player-season as per-game averages, across `years`. Each season
+    file is read with only the label columns and the columns `stats` need.
+
+    Returns:
+        tuple: (points, players). points has one float32 column per stat plus 'player'
+        (int32 code), 'season' and 'week' (int16, 0 at season level). players is the
+        player index: player_id, player_display_name and position, indexed by code.
+    """
+    compiled = scoring.compile_scoring(scoring_format, tuple(stat_mapping.items()))
+    needed = set(LABEL_COLUMNS) | set(stats)
+    if 'calc_fantasy_points' in stats:
+        needed |= set(compiled.weights) | {rule.column for rule in compiled.rules}
+
+    frames = []
+    for year in years:
+        available = set(season_store.season_columns(refresh.WEEKLY_DATASET, year))
+        weekly = season_store.read_season(refresh.WEEKLY_DATASET, year, columns=sorted(needed & available))
+        if 'calc_fantasy_points' in stats:
+            weekly = scoring.calculate_fantasy_points_vec(weekly, scoring_format, stat_mapping)
+        frames.append(weekly.reindex(columns=LABEL_COLUMNS + list(stats)))
+    weekly = pd.concat(frames, ignore_index=True).dropna(subset=list(stats))
+
+    if level == "season":
+        grouped = weekly.groupby(['player_id', 'season'], sort=False)
+        per_game = grouped[list(stats)].mean()
+        per_game = per_game.loc[grouped.size() >= min_games]
+        labels = grouped[['player_display_name', 'position']].last().loc[per_game.index]
+        weekly = per_game.join(labels).reset_index().assign(week=0)
+
+    codes, _ = pd.factorize(weekly['player_id'])
+    players = weekly.groupby(codes)[['player_id', 'player_display_name', 'position']].last()
+    points = pd.DataFrame({stat: weekly[stat].to_numpy(dtype='float32') for stat in stats})
+    points['player'] = codes.astype('int32')
+    points['season'] = weekly['season'].to_numpy(dtype='int16')
+    points['week'] = weekly['week'].to_numpy(dtype='int16')
+    return points, players
+
+
+def _bounds(value_range: tuple) -> tuple:
+    low, high = float(value_range[0]), float(value_range[1])
+    return (low, high) if high > low else (low, low + 1.0)
+
+
+def in_view(points: pd.DataFrame, x: str, y: str, x_range: tuple, y_range: tuple) -> np.ndarray:
+    """Boolean mask of the points inside an (x, y) view window."""
+    return (points[x].between(*x_range) & points[y].between(*y_range)).to_numpy()
+
+
+def _bin_edges(x_range: tuple, y_range: tuple, bins: int) -> tuple:
+    x_range, y_range = _bounds(x_range), _bounds(y_range)
+    return np.linspace(*x_range, bins + 1), np.linspace(*y_range, bins + 1)
+
+
+def _bin_index(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Each value's bin on `edges`, as np.histogram2d assigns it: bins are closed on the left,
+    except the last, which also holds the upper edge. Values outside the edges get -1.
+    """
+    index = np.searchsorted(edges, values, side='right') - 1
+    index[values == edges[-1]] = len(edges) - 2
+    index[(values < edges[0]) | (values > edges[-1])] = -1
+    return index
+
+
+def bin_view(points: pd.DataFrame, x: str, y: str, x_range: tuple, y_range: tuple, bins: int = BINS) -> pd.DataFrame:
+    """
+    Counts points on a bins x bins grid over the view. Only non-empty cells are returned,
+    so the browser receives at most bins ** 2 markers however many points there are.
+
+    Returns:
+        pd.DataFrame: One row per non-empty cell with its centre ('x', 'y'), 'count', and
+        grid position ('ix', 'iy') for bin_members.
+    """
+    x_edges, y_edges = _bin_edges(x_range, y_range, bins)
+    counts, _, _ = np.histogram2d(points[x], points[y], bins=[x_edges, y_edges])
+    ix, iy = np.nonzero(counts)
+    return pd.DataFrame({
+        'x': (x_edges[ix] + x_edges[ix + 1]) / 2,
+        'y': (y_edges[iy] + y_edges[iy + 1]) / 2,
+        'count': counts[ix, iy].astype('int64'),
+        'ix': ix,
+        'iy': iy,
+    })
+
+
+def bin_members(points: pd.DataFrame, x: str, y: str, x_range: tuple, y_range: tuple, cells: list,
+                bins: int = BINS) -> np.ndarray:
+    """
+    Boolean mask of the points falling in any of the (ix, iy) cells of a bin_view grid.
+    Uses the same edges and edge rules as bin_view, so a cell lists exactly the points it counted.
+    """
+    x_edges, y_edges = _bin_edges(x_range, y_range, bins)
+    ix = _bin_index(points[x].to_numpy(dtype='float64'), x_edges)
+    iy = _bin_index(points[y].to_numpy(dtype='float64'), y_edges)
+    inside = (ix >= 0) & (iy >= 0)
+    wanted = np.zeros((bins, bins), dtype=bool)
+    for cell_x, cell_y in cells:
+        wanted[cell_x, cell_y] = True
+    mask = np.zeros(len(points), dtype=bool)
+    mask[inside] = wanted[ix[inside], iy[inside]]
+    return mask
+
+
+def resolve_points(points: pd.DataFrame, players: pd.DataFrame) -> pd.DataFrame:
+    """Joins points to the player index for display: name, position, season and week."""
+    labels = players.iloc[points['player'].to_numpy()].reset_index(drop=True)
+    return pd.concat([labels[['player_display_name', 'position']], points.drop(columns='player').reset_index(drop=True)],
+                     axis=1)
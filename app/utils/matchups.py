@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+# Counting stats that a defense "allows"; rate stats (EPA, shares) do not add up across players.
+DVP_STATS = [
+    'calc_fantasy_points',
+    'attempts', 'passing_yards', 'passing_tds',
+    'carries', 'rushing_yards', 'rushing_tds',
+    'targets', 'receptions', 'receiving_yards', 'receiving_tds',
+]
+DVP_KEYS = ['opponent_team', 'position']
+ADJUSTMENT_BOUNDS = (0.5, 2.0)  # Cap how far one matchup can scale a stat
+
+
+class DefensePrefix:
+    """
+    Week-prefix sums of what each defense allowed to each position, as a dense
+    (defense-position, week, stat) array. Totals for any week window are one subtraction of
+    two week slices, so moving the week slider never regroups the weekly rows.
+    """
+
+    def __init__(self, scored: pd.DataFrame, stats: list = None):
+        self.stats = [s for s in (stats or DVP_STATS) if s in scored.columns]
+        scored = scored.loc[scored['opponent_team'].notna()]
+        by_week = scored.groupby(DVP_KEYS + ['week'])[self.stats].sum()
+        games = scored.groupby(DVP_KEYS + ['week'])['player_id'].size().gt(0).astype('float64')
+
+        self.groups = by_week.index.droplevel('week').unique()
+        self.max_week = int(scored['week'].max())
+        full_index = pd.MultiIndex.from_tuples(
+            [(*group, week) for group in self.groups for week in range(1, self.max_week + 1)],
+            names=DVP_KEYS + ['week'])
+        shape = (len(self.groups), self.max_week, len(self.stats))
+        weekly = by_week.reindex(full_index, fill_value=0).to_numpy(dtype='float64').reshape(shape)
+        weekly_games = games.reindex(full_index, fill_value=0).to_numpy().reshape(shape[:2])
+
+        # Index 0 is the empty prefix, so week w's prefix lives at index w
+        self.cum = np.concatenate([np.zeros((shape[0], 1, shape[2])), weekly.cumsum(axis=1)], axis=1)
+        self.games_cum = np.concatenate([np.zeros((shape[0], 1)), weekly_games.cumsum(axis=1)], axis=1)
+
+    def window(self, weeks: tuple) -> pd.DataFrame:
+        """
+        Per-game stats allowed by each defense to each position over an inclusive week window.
+
+        Returns:
+            pd.DataFrame: Indexed by (opponent_team, position) with one column per stat plus 'games'.
+        """
+        start = int(np.clip(weeks[0] - 1, 0, self.max_week))
+        end = int(np.clip(weeks[1], 0, self.max_week))
+        totals = self.cum[:, end] - self.cum[:, start]
+        games = self.games_cum[:, end] - self.games_cum[:, start]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            per_game = totals / games[:, None]
+        allowed = pd.DataFrame(per_game, index=self.groups, columns=self.stats)
+        allowed['games'] = games
+        return allowed.loc[allowed['games'] > 0]
+
+
+def defense_vs_position(allowed: pd.DataFrame, position: str) -> pd.DataFrame:
+    """
+    One position's slice of a DefensePrefix window with each stat's rank among defenses
+    (1 = allows the most) and its ratio to the league average.
+    """
+    table = allowed.xs(position, level='position').copy()
+    for stat in [c for c in table.columns if c != 'games']:
+        table[f"{stat}_rank"] = table[stat].rank(ascending=False, method='min')
+        table[f"{stat}_vs_avg"] = table[stat] / table[stat].mean()
+    return table.reset_index().rename(columns={'opponent_team': 'defense'})
+
+
+def opponent_adjusted(player_data: pd.DataFrame, allowed: pd.DataFrame) -> pd.DataFrame:
+    """
+    Scales each of a player's weekly stats by how the opponent's defense compares to the
+    league average at the player's position, so tough matchups count for more.
+
+    Args:
+        player_data (pd.DataFrame): Weekly rows (any players) with opponent_team and position.
+        allowed (pd.DataFrame): DefensePrefix.window output for the same week range.
+
+    Returns:
+        pd.DataFrame: player_data with the DVP stats replaced by their adjusted values.
+    """
+    stats = [s for s in allowed.columns if s != 'games' and s in player_data.columns]
+    league_avg = allowed.groupby(level='position')[stats].transform('mean')
+    factors = (league_avg / allowed[stats]).clip(*ADJUSTMENT_BOUNDS).fillna(1.0)
+
+    keys = pd.MultiIndex.from_frame(player_data[DVP_KEYS])
+    row_factors = factors.reindex(keys).fillna(1.0).to_numpy()
+    adjusted = player_data.copy()
+    adjusted[stats] = player_data[stats].to_numpy(dtype='float64') * row_factors
+    return adjusted
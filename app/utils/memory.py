@@ -0,0 +1,133 @@
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+IDLE_TIMEOUT_S = 10 * 60  # Evict a page's derived tables after 10 minutes away from it
+SESSION_BUDGET_BYTES = 512 * 1024 ** 2  # Evict least recently viewed pages beyond this
+SESSION_EXPIRY_S = 60 * 60  # Forget sessions that have not rendered a page for an hour
+
+
+def deep_size(obj, seen: set = None) -> int:
+    """
+    Approximate bytes held by an object graph. DataFrames, Series and arrays report their
+    buffers (including Python string objects); shared objects are only counted once.
+    """
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(deep=True, index=True).sum())
+    if isinstance(obj, (pd.Series, pd.Index)):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, seen) for item in obj)
+    return size
+
+
+@st.cache_resource
+def _registry():
+    """
+    Process-wide accounting shared by all sessions:
+    {session_id: {page_key: {"bytes": int, "last_seen": float, "evicted": bool}}}
+    """
+    return {"lock": threading.Lock(), "sessions": {}}
+
+
+def session_id() -> str:
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else "no-session"
+
+
+def page_state_size(page_key: str) -> int:
+    return deep_size(getattr(st.session_state, page_key, None))
+
+
+def evict_page(page_key: str):
+    """
+    Drops a page's season-derived tables, keeping the user's selections so the page can be
+    rebuilt on return (see data_loader.sync_data_version).
+    """
+    state = getattr(st.session_state, page_key)
+    state["full_data"] = None
+    state["rank_cache"] = {}
+    state["data_version"] = 0
+    for player in state["players"]:
+        player["tables"] = {}
+    setattr(st.session_state, page_key, state)
+
+
+def _evict_stale(registry: dict, now: float, keep: str = None):
+    """
+    Evicts this session's pages idle longer than IDLE_TIMEOUT_S, then, oldest first, any more
+    other than `keep` needed to bring the session back under SESSION_BUDGET_BYTES. Forgets
+    sessions that have not rendered a page for SESSION_EXPIRY_S. The caller holds the lock.
+    """
+    pages = registry["sessions"].get(session_id(), {})
+    session_bytes = sum(page["bytes"] for page in pages.values() if not page["evicted"])
+    live = sorted(((key, page) for key, page in pages.items() if not page["evicted"]),
+                  key=lambda item: item[1]["last_seen"])
+    for key, page in live:
+        idle = now - page["last_seen"] >= IDLE_TIMEOUT_S
+        if not idle and (key == keep or session_bytes <= SESSION_BUDGET_BYTES):
+            continue
+        evict_page(key)
+        session_bytes -= page["bytes"]
+        pages[key] = {"bytes": page_state_size(key), "last_seen": page["last_seen"], "evicted": True}
+
+    # Forget sessions that have gone quiet; their state is released when Streamlit drops them
+    for expired in [sid for sid, session_pages in registry["sessions"].items()
+                    if now - max(p["last_seen"] for p in session_pages.values()) > SESSION_EXPIRY_S]:
+        del registry["sessions"][expired]
+
+
+def track_page(page_key: str):
+    """
+    Records the current page's size and evicts this session's stale pages (see _evict_stale).
+    Call at the end of a page's setup.
+    """
+    now = time.time()
+    registry = _registry()
+    with registry["lock"]:
+        pages = registry["sessions"].setdefault(session_id(), {})
+        pages[page_key] = {"bytes": page_state_size(page_key), "last_seen": now, "evicted": False}
+        _evict_stale(registry, now, keep=page_key)
+
+
+def sweep_idle():
+    """
+    Evicts this session's stale pages without recording a page, so idle pages are released
+    even while the user stays on pages that are not tracked. The most recently seen page is
+    only evicted once idle. Called by main.py on every rerun.
+    """
+    registry = _registry()
+    with registry["lock"]:
+        pages = registry["sessions"].get(session_id(), {})
+        latest = max(pages, key=lambda key: pages[key]["last_seen"], default=None)
+        _evict_stale(registry, time.time(), keep=latest)
+
+
+def memory_report() -> pd.DataFrame:
+    """
+    One row per (session, page) with the bytes last measured, for every live session in the process.
+    """
+    registry = _registry()
+    with registry["lock"]:
+        rows = [
+            {"session": sid[:8], "page": page_key, "mb": page["bytes"] / 1024 ** 2,
+             "idle_s": time.time() - page["last_seen"], "evicted": page["evicted"]}
+            for sid, pages in registry["sessions"].items()
+            for page_key, page in pages.items()
+        ]
+    return pd.DataFrame(rows, columns=["session", "page", "mb", "idle_s", "evicted"])
@@ -0,0 +1,185 @@
+import pandas as pd
+
+# Every stat shown on a KPI card for any position, plus fantasy points.
+TREND_STATS = [
+    'calc_fantasy_points',
+    # PASSING
+    'attempts', 'passing_yards', 'passing_tds', 'passing_air_yards', 'passing_epa', 'pacr',
+    # RUSHING
+    'carries', 'rushing_yards', 'rushing_tds', 'rushing_epa',
+    # RECEIVING
+    'targets', 'receptions', 'receiving_yards', 'receiving_tds', 'receiving_yards_after_catch',
+    'receiving_air_yards', 'receiving_epa', 'target_share', 'wopr',
+]
+
+ROLLING_WINDOW = 3
+EWM_SPAN = 4
+FLOOR_QUANTILE = 0.1
+CEILING_QUANTILE = 0.9
+BOOM_QUANTILE = 0.8  # A boom week beats 80% of the position's player-weeks
+BUST_QUANTILE = 0.2
+
+PLAYER_KEY = 'player_id'
+ORDER_KEYS = ['player_id', 'season', 'week']
+
+
+def add_trend_columns(df: pd.DataFrame,
+                      stats: list = None,
+                      window: int = ROLLING_WINDOW,
+                      span: int = EWM_SPAN) -> pd.DataFrame:
+    """
+    Adds per-player trend columns for every stat in one grouped pass over all players.
+
+    For each stat the following columns are added:
+        {stat}_roll  rolling mean over the last `window` games
+        {stat}_ewm   exponentially weighted mean with the given span
+        {stat}_wow   change from the player's previous game
+        {stat}_cum   season-to-date running total (a week prefix sum)
+        {stat}_boom  1.0 when the week beats the position's boom line
+        {stat}_bust  1.0 when the week falls below the position's bust line
+    plus 'games_cum', the running count of games played.
+
+    Args:
+        df (pd.DataFrame): Weekly player data, already scored.
+        stats (list): Stat columns to trend. Defaults to TREND_STATS.
+        window (int): Rolling window length in games.
+        span (int): EWM span in games.
+
+    Returns:
+        pd.DataFrame: A copy of df sorted by player and week with the trend columns appended.
+    """
+    stats = [s for s in (stats or TREND_STATS) if s in df.columns]
+    df = df.sort_values(ORDER_KEYS, ignore_index=True)
+    return _with_boom_bust(pd.concat([df, _window_columns(df, stats, window, span)], axis=1), stats)
+
+
+def update_trend_columns(trend_df: pd.DataFrame,
+                         new_rows: pd.DataFrame,
+                         changed_weeks: list,
+                         stats: list = None,
+                         window: int = ROLLING_WINDOW,
+                         span: int = EWM_SPAN) -> pd.DataFrame:
+    """
+    Replaces the rows of `changed_weeks` in a frame built by add_trend_columns with `new_rows`.
+    Window columns are recomputed only for players with rows in the changed weeks; boom/bust
+    flags are re-derived for everyone because the position lines move with new data.
+
+    Args:
+        trend_df (pd.DataFrame): Output of add_trend_columns.
+        new_rows (pd.DataFrame): Scored weekly rows for exactly the changed weeks.
+        changed_weeks (list): Weeks being replaced or appended.
+
+    Returns:
+        pd.DataFrame: A new frame; trend_df is not modified.
+    """
+    stats = [s for s in (stats or TREND_STATS) if s in new_rows.columns]
+    changed_mask = trend_df['week'].isin(changed_weeks)
+    affected_players = pd.Index(trend_df.loc[changed_mask, PLAYER_KEY]).union(pd.Index(new_rows[PLAYER_KEY]))
+
+    kept = trend_df.loc[~changed_mask]
+    affected = kept[PLAYER_KEY].isin(affected_players)
+    recompute = pd.concat([kept.loc[affected, new_rows.columns], new_rows], ignore_index=True)
+    recompute = recompute.sort_values(ORDER_KEYS, ignore_index=True)
+    recomputed = pd.concat([recompute, _window_columns(recompute, stats, window, span)], axis=1)
+
+    combined = pd.concat([kept.loc[~affected], recomputed], ignore_index=True)
+    return _with_boom_bust(combined.sort_values(ORDER_KEYS, ignore_index=True), stats)
+
+
+def _window_columns(df: pd.DataFrame, stats: list, window: int, span: int) -> pd.DataFrame:
+    """
+    Per-player rolling, EWM, diff and prefix-sum columns for a frame sorted by ORDER_KEYS.
+    """
+    values = df[stats].astype('float64')
+    grouped = values.groupby(df[PLAYER_KEY], sort=False)
+
+    rolling = grouped.rolling(window, min_periods=1).mean().reset_index(level=0, drop=True)
+    ewm = grouped.ewm(span=span, adjust=True).mean().reset_index(level=0, drop=True)
+
+    return pd.concat([
+        rolling.sort_index().add_suffix('_roll'),
+        ewm.sort_index().add_suffix('_ewm'),
+        grouped.diff().add_suffix('_wow'),
+        grouped.cumsum().add_suffix('_cum'),
+        pd.DataFrame({'games_cum': df.groupby(PLAYER_KEY, sort=False).cumcount() + 1}),
+    ], axis=1)
+
+
+def _with_boom_bust(df: pd.DataFrame, stats: list) -> pd.DataFrame:
+    """
+    Sets the {stat}_boom/{stat}_bust flags against the position's weekly quantile lines.
+    """
+    values = df[stats].astype('float64')
+    by_position = values.groupby(df['position'])
+    boom_lines = by_position.quantile(BOOM_QUANTILE).reindex(df['position']).to_numpy()
+    bust_lines = by_position.quantile(BUST_QUANTILE).reindex(df['position']).to_numpy()
+
+    flags = pd.concat([
+        pd.DataFrame((values.to_numpy() >= boom_lines).astype('float64'),
+                     columns=[f"{s}_boom" for s in stats], index=df.index),
+        pd.DataFrame((values.to_numpy() <= bust_lines).astype('float64'),
+                     columns=[f"{s}_bust" for s in stats], index=df.index),
+    ], axis=1)
+    return pd.concat([df.drop(columns=flags.columns, errors='ignore'), flags], axis=1)
+
+
+def summarize_consistency(trend_df: pd.DataFrame, stats: list = None) -> pd.DataFrame:
+    """
+    Summarizes week-to-week consistency per player from a frame built by add_trend_columns.
+
+    Args:
+        trend_df (pd.DataFrame): Output of add_trend_columns, optionally filtered to a week range.
+        stats (list): Stats to summarize. Defaults to TREND_STATS.
+
+    Returns:
+        pd.DataFrame: One row per player_display_name with {stat}_std, {stat}_floor,
+        {stat}_ceiling, {stat}_boom_rate and {stat}_bust_rate columns.
+    """
+    stats = [s for s in (stats or TREND_STATS) if s in trend_df.columns]
+    grouped = trend_df.groupby('player_display_name', sort=False)
+
+    summary = pd.concat([
+        grouped[stats].std(ddof=0).add_suffix('_std'),
+        grouped[stats].quantile(FLOOR_QUANTILE).add_suffix('_floor'),
+        grouped[stats].quantile(CEILING_QUANTILE).add_suffix('_ceiling'),
+        grouped[[f"{s}_boom" for s in stats]].mean().add_suffix('_rate'),
+        grouped[[f"{s}_bust" for s in stats]].mean().add_suffix('_rate'),
+    ], axis=1)
+    return summary.reset_index()
+
+
+def window_totals(trend_df: pd.DataFrame, weeks: tuple, stats: list = None) -> pd.DataFrame:
+    """
+    Returns per-player totals and games played over an inclusive week window using the
+    '_cum' prefix columns, so no regrouping of the raw weekly rows is needed.
+
+    Args:
+        trend_df (pd.DataFrame): Output of add_trend_columns.
+        weeks (tuple): (first_week, last_week), inclusive.
+        stats (list): Stats to total. Defaults to TREND_STATS.
+
+    Returns:
+        pd.DataFrame: Indexed by player_id with one column per stat plus 'games'.
+    """
+    stats = [s for s in (stats or TREND_STATS) if f"{s}_cum" in trend_df.columns]
+    cum_cols = [f"{s}_cum" for s in stats] + ['games_cum']
+    start, end = weeks
+
+    # Last row at or before each bound is the prefix value for that bound.
+    upper = trend_df.loc[trend_df['week'] <= end].groupby(PLAYER_KEY, sort=False)[cum_cols].last()
+    lower = trend_df.loc[trend_df['week'] < start].groupby(PLAYER_KEY, sort=False)[cum_cols].last()
+    totals = upper.sub(lower.reindex(upper.index).fillna(0))
+    totals.columns = stats + ['games']
+    return totals.loc[totals['games'] > 0]
+
+
+def player_trend(trend_df: pd.DataFrame, player_name: str, weeks: tuple) -> pd.DataFrame:
+    """
+    Slices the precomputed trend rows for one player within an inclusive week range.
+    """
+    mask = (
+        (trend_df['player_display_name'].to_numpy() == player_name)
+        & (trend_df['week'].to_numpy() >= weeks[0])
+        & (trend_df['week'].to_numpy() <= weeks[1])
+    )
+    return trend_df.loc[mask]
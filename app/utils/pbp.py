@@ -0,0 +1,189 @@
+import argparse
+import shutil
+import urllib.request
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+import utils.season_store as season_store
+
+PBP_DATASET = "pbp_weekly"
+PBP_URL = "https://github.com/nflverse/nflverse-data/releases/download/pbp/play_by_play_{year}.parquet"
+CHUNK_SIZE = 25_000
+
+# Column projection: the only play-by-play columns ever materialized.
+PBP_COLUMNS = [
+    "season", "week", "posteam", "down", "yardline_100",
+    "rush_attempt", "two_point_attempt",
+    "receiver_player_id", "rusher_player_id",
+]
+
+REDZONE_YARDLINE = 20
+GOAL_LINE_YARDLINE = 5
+
+KEYS = ["player_id", "team", "season", "week"]
+COUNT_COLUMNS = [
+    "pbp_targets", "redzone_targets", "goal_line_targets", "third_down_targets",
+    "pbp_carries", "redzone_carries", "goal_line_carries", "third_down_carries",
+]
+
+
+def iter_pbp_chunks(path, columns: list = None, chunk_size: int = CHUNK_SIZE):
+    """
+    Yields a play-by-play file as DataFrames of at most chunk_size rows, reading only the
+    requested columns. Supports parquet and csv (optionally gzipped) files.
+    """
+    path = Path(path)
+    columns = columns or PBP_COLUMNS
+    if path.name.endswith((".csv", ".csv.gz")):
+        yield from pd.read_csv(path, usecols=lambda c: c in columns, chunksize=chunk_size, low_memory=False)
+    else:
+        parquet_file = pq.ParquetFile(path)
+        available = [c for c in columns if c in parquet_file.schema_arrow.names]
+        for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=available):
+            yield batch.to_pandas()
+
+
+def fold_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reduces a chunk of plays to per-player-week usage counts indexed by KEYS.
+    Every target and carry is credited to exactly one player, so team totals can be
+    recovered later by summing over a team's players.
+    """
+    if "two_point_attempt" in chunk:
+        chunk = chunk.loc[chunk["two_point_attempt"].fillna(0) == 0]
+    redzone = chunk["yardline_100"] <= REDZONE_YARDLINE
+    goal_line = chunk["yardline_100"] <= GOAL_LINE_YARDLINE
+    third_down = chunk["down"] == 3
+
+    is_target = chunk["receiver_player_id"].notna()
+    is_carry = (chunk["rush_attempt"] == 1) & chunk["rusher_player_id"].notna()
+    play_keys = {"team": chunk["posteam"], "season": chunk["season"], "week": chunk["week"]}
+
+    targets = pd.DataFrame({
+        "player_id": chunk["receiver_player_id"],
+        **play_keys,
+        "pbp_targets": 1,
+        "redzone_targets": redzone,
+        "goal_line_targets": goal_line,
+        "third_down_targets": third_down,
+    }).loc[is_target]
+    carries = pd.DataFrame({
+        "player_id": chunk["rusher_player_id"],
+        **play_keys,
+        "pbp_carries": 1,
+        "redzone_carries": redzone,
+        "goal_line_carries": goal_line,
+        "third_down_carries": third_down,
+    }).loc[is_carry]
+
+    usage = pd.concat([targets, carries], ignore_index=True)
+    usage[COUNT_COLUMNS] = usage.reindex(columns=COUNT_COLUMNS).fillna(0).astype("int32")
+    return usage.groupby(KEYS, sort=False)[COUNT_COLUMNS].sum()
+
+
+def finalize_usage(counts: pd.DataFrame) -> pd.DataFrame:
+    """
+    Turns folded usage counts into the stored per-player-week frame with team shares.
+    """
+    counts = counts.reset_index()
+    team_totals = counts.groupby(["team", "season", "week"])[COUNT_COLUMNS].transform("sum")
+
+    def share(numerator, denominator):
+        return (numerator / denominator.where(denominator > 0)).fillna(0).astype("float32")
+
+    counts["redzone_target_share"] = share(counts["redzone_targets"], team_totals["redzone_targets"])
+    counts["redzone_carry_share"] = share(counts["redzone_carries"], team_totals["redzone_carries"])
+    counts["goal_line_share"] = share(
+        counts["goal_line_targets"] + counts["goal_line_carries"],
+        team_totals["goal_line_targets"] + team_totals["goal_line_carries"],
+    )
+    counts["third_down_share"] = share(
+        counts["third_down_targets"] + counts["third_down_carries"],
+        team_totals["third_down_targets"] + team_totals["third_down_carries"],
+    )
+    counts["season"] = counts["season"].astype("int32")
+    counts["week"] = counts["week"].astype("int32")
+    return counts.drop(columns="team").sort_values(["player_id", "week"], ignore_index=True)
+
+
+def aggregate_pbp_file(path, chunk_size: int = CHUNK_SIZE) -> pd.DataFrame:
+    """
+    Streams one play-by-play file and returns its per-player-week usage frame.
+    Only the running aggregate (one row per player-week) is held between chunks.
+    """
+    running = None
+    for chunk in iter_pbp_chunks(path, chunk_size=chunk_size):
+        folded = fold_chunk(chunk)
+        running = folded if running is None else running.add(folded, fill_value=0)
+    if running is None:
+        return pd.DataFrame(columns=["player_id", "season", "week"] + COUNT_COLUMNS)
+    return finalize_usage(running.astype("int32"))
+
+
+def join_usage(weekly: pd.DataFrame, pbp_usage: pd.DataFrame = None) -> pd.DataFrame:
+    """
+    Left-joins a season's stored usage frame onto its weekly rows; players without
+    play-by-play usage get zeros. Returns weekly unchanged if the season was not ingested.
+    """
+    if pbp_usage is None:
+        return weekly
+    weekly = weekly.merge(pbp_usage, on=["player_id", "season", "week"], how="left")
+    usage_cols = [c for c in pbp_usage.columns if c not in ("player_id", "season", "week")]
+    weekly[usage_cols] = weekly[usage_cols].fillna(0)
+    return weekly
+
+
+def locate_pbp_source(year: int, source_dir=None) -> Path:
+    """
+    Finds the raw play-by-play file for a season. With source_dir, looks for the nflverse
+    file name (play_by_play_{year}.parquet/.csv/.csv.gz) there; otherwise downloads the
+    nflverse release file into the store's raw area once and reuses it afterwards.
+    """
+    if source_dir is not None:
+        for suffix in (".parquet", ".csv", ".csv.gz"):
+            candidate = Path(source_dir) / f"play_by_play_{year}{suffix}"
+            if candidate.exists():
+                return candidate
+        raise FileNotFoundError(f"No play-by-play file for {year} in {source_dir}")
+
+    raw_path = season_store.STORE_ROOT / "raw" / "pbp" / f"play_by_play_{year}.parquet"
+    if not raw_path.exists():
+        raw_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = raw_path.with_suffix(".parquet.tmp")
+        with urllib.request.urlopen(PBP_URL.format(year=year)) as response, open(tmp_path, "wb") as out:
+            shutil.copyfileobj(response, out)  # Stream to disk, never hold the file in memory
+        tmp_path.replace(raw_path)
+    return raw_path
+
+
+def ingest_pbp(years, source_dir=None, chunk_size: int = CHUNK_SIZE) -> list:
+    """
+    Aggregates play-by-play into per-player-week usage and writes one store file per season.
+    Seasons are processed one at a time, so peak memory does not grow with the number of seasons.
+
+    Args:
+        years: A season or list of seasons.
+        source_dir: Optional directory of local play-by-play files (e.g. fixtures).
+        chunk_size (int): Rows per streamed chunk.
+
+    Returns:
+        list: Paths of the written season files.
+    """
+    years = years if isinstance(years, (list, tuple, range)) else [years]
+    written = []
+    for year in years:
+        usage = aggregate_pbp_file(locate_pbp_source(year, source_dir), chunk_size=chunk_size)
+        written.append(season_store.write_season(usage, PBP_DATASET, year))
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ingest play-by-play into weekly usage metrics.")
+    parser.add_argument("years", nargs="+", type=int)
+    parser.add_argument("--source-dir", default=None, help="Directory of local play-by-play files.")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+    for written_path in ingest_pbp(args.years, args.source_dir, args.chunk_size):
+        print(written_path)
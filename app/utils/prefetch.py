@@ -0,0 +1,162 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import streamlit as st
+
+import utils.memory as memory
+import utils.metrics as metrics
+import utils.pbp as pbp
+import utils.refresh as refresh
+import utils.scoring as scoring
+import utils.season_store as season_store
+
+PREFETCH_BUDGET_BYTES = 256 * 1024 ** 2  # Least recently used warm seasons are dropped beyond this
+SEASONS = range(1999, 2025)  # The seasons offered by components.selectas.year_selector
+ADJACENT_SEASONS = 1  # Warm this many seasons either side of each open page's season
+
+
+def season_key(year, scoring_format, stat_mapping: dict) -> tuple:
+    """(year, scoring_format, stat_mapping items), the same key shape as the trend cache."""
+    return (year, scoring_format, tuple(stat_mapping.items()))
+
+
+def warm_season(key: tuple, cancelled: threading.Event):
+    """
+    Loads (downloading if needed), scores and trends one season off the script thread.
+    Touches no Streamlit APIs. Checks `cancelled` between steps.
+
+    Returns:
+        dict: "version", "scored" (the page's full_data) and "trends" (load_trend_metrics'
+        frame), or None if cancelled.
+    """
+    year, scoring_format, stat_mapping_items = key
+    weekly = refresh.ensure_weekly_season(year)  # Waits on a foreground download of the same season
+    if cancelled.is_set():
+        return None
+    weekly = pbp.join_usage(weekly, season_store.read_season(pbp.PBP_DATASET, year))
+    scored = scoring.calculate_fantasy_points_vec(weekly, scoring_format, dict(stat_mapping_items))
+    if cancelled.is_set():
+        return None
+    return {"version": refresh.data_version(year), "scored": scored, "trends": metrics.add_trend_columns(scored)}
+
+
+class Prefetcher:
+    """
+    One background worker that warms seasons pages are likely to switch to next. Finished
+    seasons are kept least recently used first and dropped beyond `budget_bytes`. A foreground
+    load waits only on a running job for exactly the load it is making; a matching job that
+    is still queued is cancelled and the load is done in the foreground instead.
+    """
+
+    def __init__(self, budget_bytes: int = PREFETCH_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self.disabled_sessions = set()  # Sessions that switched prefetching off
+        self.lock = threading.RLock()  # Done callbacks can run inside schedule/cancel
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        self.jobs = {}  # {key: (future, cancelled event, session id)}
+        self.results = OrderedDict()  # {key: (result, bytes)}
+
+    def schedule(self, keys: list, session: str):
+        """
+        Queues every key not already warm or queued, in order. This session's queued jobs
+        that are no longer wanted are cancelled, so a user moving on does not wait on them.
+        """
+        if session in self.disabled_sessions:
+            return
+        with self.lock:
+            for key, (future, _, owner) in list(self.jobs.items()):
+                if owner == session and key not in keys and future.cancel():
+                    self.jobs.pop(key, None)
+            for key in keys:
+                if key in self.jobs:
+                    continue
+                cached = self.results.get(key)
+                if cached is not None and cached[0]["version"] == refresh.data_version(key[0]):
+                    continue
+                cancelled = threading.Event()
+                future = self.executor.submit(warm_season, key, cancelled)
+                self.jobs[key] = (future, cancelled, session)
+                future.add_done_callback(lambda done, key=key: self._store(key, done))
+
+    def _store(self, key: tuple, future):
+        with self.lock:
+            if key in self.jobs and self.jobs[key][0] is future:
+                del self.jobs[key]
+            if future.cancelled() or future.exception() is not None or future.result() is None:
+                return
+            result = future.result()
+            self.results[key] = (result, memory.deep_size(result))
+            self.results.move_to_end(key)
+            while self.results and sum(size for _, size in self.results.values()) > self.budget_bytes:
+                self.results.popitem(last=False)
+
+    def claim(self, key: tuple):
+        """
+        Prepares a foreground load of exactly `key`: a queued job for it is cancelled (the
+        caller loads it now) and a running one is waited on. Other jobs are left alone.
+        """
+        with self.lock:
+            job = self.jobs.get(key)
+            if job is None:
+                return
+            future = job[0]
+            if future.cancel():
+                self.jobs.pop(key, None)
+                return
+        future.exception()  # Waits; a failed prefetch is retried by the foreground load
+
+    def take(self, key: tuple, version: int, part: str):
+        """
+        The warmed "scored" or "trends" frame for `key` if it matches `version`, else None.
+        Claims the key first, so it never waits behind unrelated queued work.
+        """
+        self.claim(key)
+        with self.lock:
+            cached = self.results.get(key)
+            if cached is None or cached[0]["version"] != version:
+                return None
+            self.results.move_to_end(key)
+            return cached[0][part]
+
+    def cancel(self, session: str = None):
+        """Cancels queued jobs and abandons running ones, for one session or all of them."""
+        with self.lock:
+            for key, (future, cancelled, owner) in list(self.jobs.items()):
+                if session is None or owner == session:
+                    cancelled.set()
+                    if future.cancel():
+                        self.jobs.pop(key, None)
+
+    def status(self) -> pd.DataFrame:
+        """One row per queued, running or warm season."""
+        with self.lock:
+            rows = [{"season": key[0], "format": key[1].name, "state": "running" if future.running() else "queued",
+                     "mb": 0.0} for key, (future, _, _) in self.jobs.items()]
+            rows += [{"season": key[0], "format": key[1].name, "state": "warm", "mb": size / 1024 ** 2}
+                     for key, (_, size) in self.results.items()]
+        return pd.DataFrame(rows, columns=["season", "format", "state", "mb"])
+
+
+@st.cache_resource
+def prefetcher() -> Prefetcher:
+    """The process-wide Prefetcher shared by every session."""
+    return Prefetcher()
+
+
+def warm_up_keys(page_states: list, scoring_formats: list) -> list:
+    """
+    Seasons likely to be opened next from the given page states: each page's adjacent
+    seasons under its format, then its season under the session's other saved formats.
+    """
+    keys = []
+    for state in page_states:
+        year, scoring_format, stat_mapping = (state["selected_year"], state["selected_scoring_format"],
+                                              state["stat_mapping"])
+        for offset in range(1, ADJACENT_SEASONS + 1):
+            for adjacent in (year - offset, year + offset):
+                if adjacent in SEASONS:
+                    keys.append(season_key(adjacent, scoring_format, stat_mapping))
+        keys += [season_key(year, other, stat_mapping) for other in scoring_formats if other != scoring_format]
+    return list(dict.fromkeys(keys))
@@ -0,0 +1,129 @@
+import argparse
+import threading
+
+import nfl_data_py as nfl
+import pandas as pd
+
+import utils.season_store as season_store
+
+WEEKLY_DATASET = "weekly"
+MAX_RECORDED_CHANGES = 52  # Sessions older than this many refreshes fall back to a full reload
+
+_season_locks = {}
+_season_locks_guard = threading.Lock()
+
+
+def season_lock(year: int) -> threading.RLock:
+    """
+    The process-wide lock held while a season is downloaded or rewritten, by foreground
+    loads and background prefetches alike, so a season is never fetched or written twice at once.
+    """
+    with _season_locks_guard:
+        return _season_locks.setdefault(year, threading.RLock())
+
+
+def week_hashes(df: pd.DataFrame) -> pd.Series:
+    """
+    Returns an order-independent content hash per week: the wrapped sum of every row's hash.
+    """
+    row_hashes = pd.util.hash_pandas_object(df[sorted(df.columns)], index=False)
+    return row_hashes.groupby(df["week"].to_numpy()).sum()
+
+
+def diff_weeks(stored: pd.DataFrame, fresh: pd.DataFrame) -> list:
+    """
+    Lists the weeks of `fresh` that are missing from `stored` or whose rows differ.
+    """
+    stored_hashes = week_hashes(stored)
+    fresh_hashes = week_hashes(fresh)
+    changed = fresh_hashes.index[fresh_hashes.ne(stored_hashes.reindex(fresh_hashes.index))]
+    return sorted(int(week) for week in changed)
+
+
+def store_weekly_season(year: int, fresh: pd.DataFrame = None) -> pd.DataFrame:
+    """
+    Writes a full season of weekly data to the store as version 1 of its history.
+    Downloads the season when `fresh` is not given.
+    """
+    with season_lock(year):
+        if fresh is None:
+            fresh = nfl.import_weekly_data([year], downcast=True)
+        season_store.write_season(fresh, WEEKLY_DATASET, year)
+        season_store.write_manifest({"version": 1, "changes": []}, WEEKLY_DATASET, year)
+    return fresh
+
+
+def ensure_weekly_season(year: int) -> pd.DataFrame:
+    """
+    Reads a season from the store, downloading it first if it is missing. The store is
+    re-checked under season_lock, so a caller that waited on another download reads its result.
+    """
+    with season_lock(year):
+        stored = season_store.read_season(WEEKLY_DATASET, year)
+        return stored if stored is not None else store_weekly_season(year)
+
+
+def refresh_season(year: int, fresh: pd.DataFrame = None) -> list:
+    """
+    Re-fetches a season and replaces only the weeks whose rows are new or changed.
+    Each refresh that changes something bumps the season's version and records which
+    weeks it touched, so readers holding an older version can update incrementally.
+
+    Args:
+        year (int): The season to refresh.
+        fresh (pd.DataFrame): Optional already-fetched weekly data for the season.
+
+    Returns:
+        list: The weeks that were replaced (empty when nothing changed).
+    """
+    with season_lock(year):
+        stored = season_store.read_season(WEEKLY_DATASET, year)
+        if fresh is None:
+            fresh = nfl.import_weekly_data([year], downcast=True)
+        if stored is None:
+            store_weekly_season(year, fresh)
+            return sorted(int(week) for week in fresh["week"].unique())
+
+        changed = diff_weeks(stored, fresh)
+        if not changed:
+            return []
+
+        kept = stored.loc[~stored["week"].isin(changed)]
+        updated = pd.concat([kept, fresh.loc[fresh["week"].isin(changed), stored.columns]], ignore_index=True)
+        season_store.write_season(updated.sort_values(["week", "player_id"], ignore_index=True), WEEKLY_DATASET, year)
+
+        manifest = season_store.read_manifest(WEEKLY_DATASET, year)
+        manifest["version"] += 1
+        manifest["changes"] = (manifest["changes"] + [{"version": manifest["version"], "weeks": changed}])[
+            -MAX_RECORDED_CHANGES:]
+        season_store.write_manifest(manifest, WEEKLY_DATASET, year)
+        return changed
+
+
+def data_version(year: int) -> int:
+    """
+    Current version of a stored season; 0 if it has not been stored yet.
+    """
+    return season_store.read_manifest(WEEKLY_DATASET, year)["version"]
+
+
+def changed_weeks_since(year: int, version: int):
+    """
+    Weeks replaced by every refresh after `version`, or None when that history is not
+    available (the caller must then reload the season in full).
+    """
+    manifest = season_store.read_manifest(WEEKLY_DATASET, year)
+    if version == manifest["version"]:
+        return []
+    newer = [change for change in manifest["changes"] if change["version"] > version]
+    if version < 1 or len(newer) != manifest["version"] - version:
+        return None
+    return sorted({week for change in newer for week in change["weeks"]})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Append new or changed weeks to stored seasons.")
+    parser.add_argument("years", nargs="+", type=int)
+    args = parser.parse_args()
+    for refresh_year in args.years:
+        print(f"{refresh_year}: replaced weeks {refresh_season(refresh_year)}")
@@ -1,5 +1,11 @@
+import json
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
-import streamlit as st
+
+from utils.scoring_rules import CompiledScoring, PositionMultiplierRule, rule_to_dict, rule_from_dict
 
 class ScoringFormat:
     """Stores a set of scoring rules with flexibility for custom formats."""
@@ -18,24 +24,27 @@ class ScoringFormat:
         "fumble_lost_value": -2
     }
 
-    def __init__(self, name: str, **kwargs):
+    def __init__(self, name: str, rules=(), **kwargs):
         """
         Initializes a ScoringFormat with a name and user-defined values.
         Any missing values will default to standard scoring values.
+        `rules` holds optional non-linear rules from utils.scoring_rules (bonuses, tiers,
+        position premiums and multipliers, weights on arbitrary columns).
         """
         self.name = name
         self.values = {**self.DEFAULT_VALUES, **kwargs}  # Merge defaults with user input
+        self.rules = tuple(rules)
 
     def __repr__(self):
-        return f"ScoringFormat(name={self.name}, values={self.values})"
+        return f"ScoringFormat(name={self.name}, values={self.values}, rules={self.rules})"
 
     def __eq__(self, other):
         if isinstance(other, ScoringFormat):
-            return self.name == other.name and self.values == other.values
+            return self.name == other.name and self.values == other.values and self.rules == other.rules
         return False
 
     def __hash__(self):
-        return hash((self.name, tuple(sorted(self.values.items()))))
+        return hash((self.name, tuple(sorted(self.values.items())), self.rules))
 
     def to_markdown(self):
         """
@@ -45,6 +54,8 @@ class ScoringFormat:
         for key, value in self.values.items():
             readable_key = key.replace("_value", "").replace("_", " ").title()
             markdown_str += f"**{readable_key}**: {value} pts\n\n"
+        for rule in self.rules:
+            markdown_str += f"**{rule.label}**: {rule.describe()}\n\n"
         return markdown_str
 
     def validate(self):
@@ -61,6 +72,21 @@ class ScoringFormat:
         """
         return self.values.get(key, 0)
 
+    def to_dict(self):
+        return {"name": self.name, "values": dict(self.values), "rules": [rule_to_dict(r) for r in self.rules]}
+
+    def cache_key(self) -> str:
+        """
+        Canonical JSON of to_dict(). Streamlit cannot hash a ScoringFormat, so cached loaders
+        take the format as an unhashed `_scoring_format` argument alongside this key.
+        """
+        return json.dumps(self.to_dict(), sort_keys=True)
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        rules = [rule_from_dict(r) for r in data.get("rules", [])]
+        return cls(data["name"], rules=rules, **data["values"])
+
 
 # **Predefined Scoring Formats**
 class StandardScoringFormat(ScoringFormat):
@@ -84,6 +110,24 @@ def create_custom_scoring_format(name: str, custom_values: dict) -> ScoringForma
     return scoring_format
 
 
+def dump_scoring_formats(scoring_formats: list) -> str:
+    """
+    Serializes scoring formats to JSON so they can be reused outside a Streamlit session.
+    """
+    return json.dumps([scoring_format.to_dict() for scoring_format in scoring_formats], indent=2)
+
+
+def load_scoring_formats(path) -> list:
+    """
+    Reads a JSON file written from dump_scoring_formats. Raises FileNotFoundError if the file is missing.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Scoring formats file not found: {path}")
+    with open(path) as f:
+        return [ScoringFormat.from_dict(data) for data in json.load(f)]
+
+
 
 # Dict of {column_name: attr_name} for use with the nfl-data-py library
 stat_mapping_nfl_py = {
@@ -130,37 +174,39 @@ def calculate_avg_stats(stats_df: pd.DataFrame) -> pd.DataFrame:
     return grouped
 
 
+@lru_cache(maxsize=64)
+def compile_scoring(scoring_format: ScoringFormat, stat_mapping_items: tuple) -> CompiledScoring:
+    """Compiles a scoring format once per (format, stat mapping); see utils.scoring_rules.CompiledScoring."""
+    return CompiledScoring(scoring_format, dict(stat_mapping_items))
+
+
 def calculate_fantasy_points(stats_row: pd.Series, scoring_format: ScoringFormat, stat_mapping: dict, debug=False) -> float:
     """Calculates the total fantasy points for a given player's stat row using the provided scoring format."""
-    total_points = 0.0
-    for column, scoring_attribute in stat_mapping.items():
-        if column in stats_row:
-            stat_value = stats_row[column]
-            score_value = scoring_format.get_value(scoring_attribute)
-            total_points += stat_value * score_value
-            if debug:
-                print(f"{column}: {stat_value}, {scoring_attribute}: {score_value}")
+    if debug:
+        for column, scoring_attribute in stat_mapping.items():
+            if column in stats_row:
+                print(f"{column}: {stats_row[column]}, {scoring_attribute}: {scoring_format.get_value(scoring_attribute)}")
 
-    return round(total_points, 2)
+    # Score the row as a one-row frame so rules behave exactly as in the vectorized path
+    compiled = compile_scoring(scoring_format, tuple(stat_mapping.items()))
+    total_points = compiled.points(stats_row.to_frame().T.infer_objects())[0]
+    return round(float(total_points), 2)
 
 
 def calculate_fantasy_points_vec(df: pd.DataFrame, scoring_format: ScoringFormat, stat_mapping: dict,
                              debug=False) -> pd.DataFrame:
     """Calculates and adds a 'fantasy_points' column to the DataFrame based on the provided scoring format."""
-    # Create a series for scoring values based on the stat_mapping
-    score_values = {column: scoring_format.get_value(scoring_attribute) for column, scoring_attribute in
-                    stat_mapping.items()}
-
-    # Calculate fantasy points using vectorized operations
-    fantasy_points = sum(df[column] * score_values[column] for column in stat_mapping if column in df)
+    compiled = compile_scoring(scoring_format, tuple(stat_mapping.items()))
 
     if debug:
         for column, scoring_attribute in stat_mapping.items():
             if column in df:
-                print(f"{column}: {df[column].head()}, {scoring_attribute}: {score_values[column]}")
+                print(f"{column}: {df[column].head()}, {scoring_attribute}: {scoring_format.get_value(scoring_attribute)}")
+        for rule in scoring_format.rules:
+            print(f"{rule.label}: {rule.describe()}")
 
     # Add the calculated fantasy points as a new column
-    df['calc_fantasy_points'] = fantasy_points.round(2)
+    df['calc_fantasy_points'] = np.round(compiled.points(df), 2)
     return df
 
 
@@ -201,6 +247,16 @@ def calculate_fantasy_points_by_category(
         for key, value in total_points_by_category.items()
     }
 
+    # Extra rules are reported under their own labels
+    for rule in scoring_format.rules:
+        if not isinstance(rule, PositionMultiplierRule):
+            readable_total_points_by_category[rule.label] = (
+                    readable_total_points_by_category.get(rule.label, 0.0) + rule.evaluate(stats_df).sum())
+    if any(isinstance(rule, PositionMultiplierRule) for rule in scoring_format.rules):
+        compiled = compile_scoring(scoring_format, tuple(stat_mapping.items()))
+        readable_total_points_by_category[PositionMultiplierRule.label] = (
+                compiled.base_points(stats_df) * (compiled.multiplier(stats_df) - 1)).sum()
+
     # Convert to pandas Series for better readability
     total_points_series = pd.Series(readable_total_points_by_category)
 
@@ -0,0 +1,179 @@
+"""
+Non-linear scoring rules that extend the flat per-unit weights of a ScoringFormat.
+Every rule evaluates a whole DataFrame at once and returns one value per row.
+"""
+from dataclasses import dataclass, asdict
+from typing import ClassVar
+
+import numpy as np
+import pandas as pd
+
+
+def column_values(df: pd.DataFrame, column: str) -> np.ndarray:
+    """
+    A stat column as float64 with missing values (or a missing column) treated as 0.
+    """
+    if column not in df:
+        return np.zeros(len(df))
+    return df[column].to_numpy(dtype="float64", na_value=0.0)
+
+
+def position_mask(df: pd.DataFrame, positions: tuple) -> np.ndarray:
+    if "position" not in df:
+        return np.zeros(len(df), dtype=bool)
+    return np.isin(df["position"].to_numpy(), positions)
+
+
+@dataclass(frozen=True)
+class LinearRule:
+    """Points per unit of any numeric column, e.g. 0.5 per first down or 0.1 per target."""
+    column: str
+    per_unit: float
+
+    type_name: ClassVar[str] = "linear"
+
+    @property
+    def label(self):
+        return self.column.replace("_", " ").title()
+
+    def describe(self):
+        return f"{self.per_unit} pts per {self.label}"
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        return column_values(df, self.column) * self.per_unit
+
+
+@dataclass(frozen=True)
+class BonusRule:
+    """Flat points whenever a stat reaches a threshold in a game, e.g. 3 pts for 100+ rushing yards."""
+    column: str
+    threshold: float
+    points: float
+
+    type_name: ClassVar[str] = "bonus"
+    label: ClassVar[str] = "Bonuses"
+
+    def describe(self):
+        return f"{self.points} pts for {self.threshold:g}+ {self.column.replace('_', ' ')}"
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        return np.where(column_values(df, self.column) >= self.threshold, self.points, 0.0)
+
+
+@dataclass(frozen=True)
+class TierRule:
+    """
+    Points from the highest tier a stat reaches in a game. `tiers` is a tuple of
+    (threshold, points) pairs, e.g. ((5, 1), (8, 3)) for receptions.
+    """
+    column: str
+    tiers: tuple
+
+    type_name: ClassVar[str] = "tier"
+    label: ClassVar[str] = "Tier Points"
+
+    def __post_init__(self):
+        # Normalize (e.g. lists from JSON) to sorted tuples so the rule stays hashable
+        object.__setattr__(self, "tiers", tuple(sorted((float(t), float(p)) for t, p in self.tiers)))
+
+    def describe(self):
+        tiers = ", ".join(f"{t:g}+: {p:g}" for t, p in self.tiers)
+        return f"{self.column.replace('_', ' ')} tiers ({tiers})"
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        values = column_values(df, self.column)
+        highest_first = self.tiers[::-1]
+        return np.select([values >= t for t, _ in highest_first], [p for _, p in highest_first], 0.0)
+
+
+@dataclass(frozen=True)
+class PositionPremiumRule:
+    """Extra points per unit of a stat for some positions, e.g. TE premium of 0.5 per reception."""
+    column: str
+    positions: tuple
+    per_unit: float
+
+    type_name: ClassVar[str] = "position_premium"
+
+    def __post_init__(self):
+        object.__setattr__(self, "positions", tuple(self.positions))
+
+    @property
+    def label(self):
+        return f"{'/'.join(self.positions)} Premium"
+
+    def describe(self):
+        return f"+{self.per_unit} pts per {self.column.replace('_', ' ')} for {'/'.join(self.positions)}"
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        return np.where(position_mask(df, self.positions), column_values(df, self.column) * self.per_unit, 0.0)
+
+
+@dataclass(frozen=True)
+class PositionMultiplierRule:
+    """Scales a player's whole game score for some positions, e.g. 1.1x for TEs."""
+    positions: tuple
+    multiplier: float
+
+    type_name: ClassVar[str] = "position_multiplier"
+    label: ClassVar[str] = "Position Multiplier"
+
+    def __post_init__(self):
+        object.__setattr__(self, "positions", tuple(self.positions))
+
+    def describe(self):
+        return f"{self.multiplier}x total for {'/'.join(self.positions)}"
+
+    def factor(self, df: pd.DataFrame) -> np.ndarray:
+        return np.where(position_mask(df, self.positions), self.multiplier, 1.0)
+
+
+RULE_TYPES = {rule.type_name: rule for rule in
+              (LinearRule, BonusRule, TierRule, PositionPremiumRule, PositionMultiplierRule)}
+
+
+def rule_to_dict(rule) -> dict:
+    return {"type": rule.type_name, **asdict(rule)}
+
+
+def rule_from_dict(data: dict):
+    fields = {key: value for key, value in data.items() if key != "type"}
+    return RULE_TYPES[data["type"]](**fields)
+
+
+class CompiledScoring:
+    """
+    A ScoringFormat lowered to NumPy: every linear weight (stat_mapping plus LinearRules) is
+    folded into one weight vector applied with a single matrix product, non-linear rules are
+    evaluated as masks / np.select, and position multipliers scale the result.
+    """
+
+    def __init__(self, scoring_format, stat_mapping: dict):
+        weights = {}
+        for column, scoring_attribute in stat_mapping.items():
+            weights[column] = weights.get(column, 0.0) + scoring_format.get_value(scoring_attribute)
+        for rule in scoring_format.rules:
+            if isinstance(rule, LinearRule):
+                weights[rule.column] = weights.get(rule.column, 0.0) + rule.per_unit
+
+        self.weights = weights
+        self.rules = [r for r in scoring_format.rules if not isinstance(r, (LinearRule, PositionMultiplierRule))]
+        self.multipliers = [r for r in scoring_format.rules if isinstance(r, PositionMultiplierRule)]
+
+    def base_points(self, df: pd.DataFrame) -> np.ndarray:
+        """Points before position multipliers."""
+        columns = [column for column in self.weights if column in df]
+        weights = np.array([self.weights[column] for column in columns], dtype="float64")
+        points = df[columns].to_numpy(dtype="float64", na_value=0.0) @ weights
+        for rule in self.rules:
+            points += rule.evaluate(df)
+        return points
+
+    def multiplier(self, df: pd.DataFrame) -> np.ndarray:
+        factor = np.ones(len(df))
+        for rule in self.multipliers:
+            factor *= rule.factor(df)
+        return factor
+
+    def points(self, df: pd.DataFrame) -> np.ndarray:
+        return self.base_points(df) * self.multiplier(df)
@@ -0,0 +1,101 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+# Root of the local columnar store. One parquet file per (dataset, season):
+#   {STORE_ROOT}/{dataset}/season={year}.parquet
+STORE_ROOT = Path(os.environ.get("FFB_DATA_DIR", Path(__file__).resolve().parents[2] / "data"))
+
+
+def season_path(dataset: str, year: int, root: Path = None) -> Path:
+    """
+    Returns the path of a season file in the store, whether or not it exists yet.
+    """
+    return Path(root or STORE_ROOT) / dataset / f"season={year}.parquet"
+
+
+def has_season(dataset: str, year: int, root: Path = None) -> bool:
+    return season_path(dataset, year, root).exists()
+
+
+def _replace(path: Path, write):
+    """
+    Calls write(tmp_path) on a uniquely named file next to `path`, then renames it into place.
+    Concurrent writers never share a temporary file, and a failed write leaves nothing behind.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False) as tmp:
+        tmp_path = Path(tmp.name)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_season(df: pd.DataFrame, dataset: str, year: int, root: Path = None) -> Path:
+    """
+    Writes one season of a dataset to the store, replacing any previous version.
+    The file is written next to its destination and renamed into place, so readers
+    never see a partially written season.
+
+    Returns:
+        Path: The path of the written file.
+    """
+    path = season_path(dataset, year, root)
+    _replace(path, lambda tmp_path: df.to_parquet(tmp_path, index=False))
+    return path
+
+
+def read_season(dataset: str, year: int, columns: list = None, root: Path = None) -> pd.DataFrame:
+    """
+    Reads one season of a dataset, optionally projecting to a subset of columns.
+    Returns None when the season has not been written.
+    """
+    path = season_path(dataset, year, root)
+    if not path.exists():
+        return None
+    return pd.read_parquet(path, columns=columns)
+
+
+def season_columns(dataset: str, year: int, root: Path = None) -> list:
+    """
+    Column names of a stored season, read from the file footer without loading any rows.
+    """
+    path = season_path(dataset, year, root)
+    return pq.read_schema(path).names if path.exists() else []
+
+
+def stored_seasons(dataset: str, root: Path = None) -> list:
+    """
+    Lists the seasons available for a dataset, in ascending order.
+    """
+    dataset_dir = Path(root or STORE_ROOT) / dataset
+    if not dataset_dir.is_dir():
+        return []
+    return sorted(int(p.stem.split("=", 1)[1]) for p in dataset_dir.glob("season=*.parquet"))
+
+
+def manifest_path(dataset: str, year: int, root: Path = None) -> Path:
+    return season_path(dataset, year, root).with_suffix(".json")
+
+
+def read_manifest(dataset: str, year: int, root: Path = None) -> dict:
+    """
+    Reads the JSON sidecar describing a season file's version history.
+    A season that was never written has version 0 and no recorded changes.
+    """
+    path = manifest_path(dataset, year, root)
+    if not path.exists():
+        return {"version": 0, "changes": []}
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_manifest(manifest: dict, dataset: str, year: int, root: Path = None):
+    _replace(manifest_path(dataset, year, root), lambda tmp_path: tmp_path.write_text(json.dumps(manifest)))
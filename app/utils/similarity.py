@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+
+from utils.standings import MIN_GAMES
+
+LABEL_COLUMNS = ['player_id', 'player_display_name', 'season', 'recent_team']
+
+
+class SimilarityIndex:
+    """
+    Per-game stat profiles for every qualified player-season at one position, z-normalized
+    per stat. The z-scores back euclidean distance; a copy scaled to unit rows makes cosine
+    similarity a single matrix-vector product.
+    """
+
+    def __init__(self, profiles: pd.DataFrame, stats: list):
+        self.stats = list(stats)
+        values = profiles[self.stats].to_numpy(dtype='float64', na_value=0.0)
+        self.mean = values.mean(axis=0)
+        self.std = np.where(values.std(axis=0) > 0, values.std(axis=0), 1.0)
+        self.zscores = ((values - self.mean) / self.std).astype('float32')
+        self.matrix = self._unit_rows(self.zscores)
+        self.labels = profiles[[c for c in LABEL_COLUMNS if c in profiles] + ['games'] + self.stats].reset_index(
+            drop=True)
+
+    @staticmethod
+    def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+        return matrix / np.where(norms > 0, norms, 1.0)
+
+    def query_vector(self, per_game: pd.Series) -> np.ndarray:
+        """Z-normalizes a player's per-game averages into the index's space."""
+        values = np.nan_to_num(per_game.reindex(self.stats).to_numpy(dtype='float64', na_value=0.0))
+        return ((values - self.mean) / self.std).astype('float32')
+
+    def top_k(self, per_game: pd.Series, k: int = 5, metric: str = 'cosine', exclude=None) -> pd.DataFrame:
+        """
+        The k most similar player-seasons to a per-game profile.
+
+        Args:
+            per_game (pd.Series): The query player's per-game averages, indexed by stat.
+            k (int): Number of neighbours to return.
+            metric (str): 'cosine' (higher is closer, ignores overall volume) or 'euclidean'
+                (distance between z-scores, so volume counts as well as shape).
+            exclude: Optional (player_id, season) to leave out, typically the query itself.
+
+        Returns:
+            pd.DataFrame: The neighbours' labels, per-game stats and a 'similarity' (cosine)
+            or 'distance' (euclidean) column.
+        """
+        query = self.query_vector(per_game)
+        if metric == 'euclidean':
+            score = -np.linalg.norm(self.zscores - query, axis=1)
+        else:
+            score = self.matrix @ self._unit_rows(query)
+        if exclude is not None:
+            score = np.where((self.labels['player_id'].to_numpy() == exclude[0])
+                             & (self.labels['season'].to_numpy() == exclude[1]), -np.inf, score)
+
+        k = min(k, len(score))
+        candidates = np.argpartition(-score, k - 1)[:k]
+        best = candidates[np.argsort(-score[candidates])]
+        neighbours = self.labels.iloc[best].copy()
+        if metric == 'euclidean':
+            neighbours['distance'] = -score[best]
+        else:
+            neighbours['similarity'] = score[best]
+        return neighbours
+
+
+def season_profiles(scored: pd.DataFrame, position: str, stats: list, min_games: int = MIN_GAMES) -> pd.DataFrame:
+    """
+    Per-game averages of `stats` for each player-season at a position with at least min_games.
+    """
+    positional = scored.loc[scored['position'] == position]
+    stats = [s for s in stats if s in positional.columns]
+    grouped = positional.groupby(['player_id', 'season'], sort=False)
+    profiles = grouped[stats].mean()
+    profiles['games'] = grouped.size()
+    labels = grouped[['player_display_name', 'recent_team']].last()
+    profiles = profiles.join(labels).reset_index()
+    return profiles.loc[profiles['games'] >= min_games]
@@ -0,0 +1,105 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+CHUNK_TRIALS = 25_000  # Trials per chunk; fixed so results do not depend on the worker count
+PARALLEL_MIN_DRAWS = 2_000_000  # Below this many trial-weeks one process beats starting a pool
+
+
+def score_samples(full_data: pd.DataFrame, players: list, points_column: str = 'calc_fantasy_points') -> tuple:
+    """
+    Packs each player's weekly scores into a padded matrix for vectorized bootstrap sampling.
+
+    Returns:
+        tuple: (scores, counts) where scores is (n_players, max_games) float32 and counts holds
+        each player's number of games. Players without games have a single 0-point game.
+    """
+    weekly = full_data.loc[full_data['player_display_name'].isin(players),
+                           ['player_display_name', points_column]]
+    by_player = {name: group[points_column].to_numpy(dtype='float32')
+                 for name, group in weekly.groupby('player_display_name', sort=False)}
+    counts = np.array([max(len(by_player.get(p, ())), 1) for p in players])
+    scores = np.zeros((len(players), counts.max()), dtype='float32')
+    for i, p in enumerate(players):
+        games = by_player.get(p, ())
+        scores[i, :len(games)] = games
+    return scores, counts
+
+
+def _simulate_chunk(scores: np.ndarray, counts: np.ndarray, n_trials: int, n_weeks: int, seed) -> np.ndarray:
+    """
+    Per-player point totals over n_weeks for n_trials trials: (n_players, n_trials) float32.
+    """
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, counts[:, None, None], size=(len(counts), n_trials, n_weeks))
+    sampled = np.take_along_axis(scores, picks.reshape(len(counts), -1), axis=1)
+    return sampled.reshape(len(counts), n_trials, n_weeks).sum(axis=2, dtype='float32')
+
+
+def simulate_player_totals(scores: np.ndarray, counts: np.ndarray, n_trials: int, n_weeks: int = 1,
+                           seed: int = 0, max_workers: int = None) -> np.ndarray:
+    """
+    Bootstraps each player's weekly score distribution for n_trials trials of n_weeks games.
+    Trials are drawn in fixed-size chunks, each from its own child of `seed`, so the same seed
+    gives the same result whether the chunks run in one process or across a pool.
+
+    Returns:
+        np.ndarray: (n_players, n_trials) simulated point totals.
+    """
+    chunk_sizes = [min(CHUNK_TRIALS, n_trials - start) for start in range(0, n_trials, CHUNK_TRIALS)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    args = [(scores, counts, size, n_weeks, chunk_seed) for size, chunk_seed in zip(chunk_sizes, seeds)]
+
+    if n_trials * n_weeks < PARALLEL_MIN_DRAWS or (max_workers or os.cpu_count() or 1) == 1:
+        chunks = [_simulate_chunk(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            chunks = list(pool.map(_simulate_chunk, *zip(*args)))
+    return np.concatenate(chunks, axis=1)
+
+
+def simulate_matchup(full_data: pd.DataFrame, lineup_a: list, lineup_b: list, n_trials: int = 100_000,
+                     seed: int = 0) -> dict:
+    """
+    Head-to-head win probability of lineup A over lineup B for one week.
+
+    Returns:
+        dict: "win_prob_a", "tie_prob", and the simulated "totals_a"/"totals_b" arrays.
+    """
+    scores, counts = score_samples(full_data, lineup_a + lineup_b)
+    totals = simulate_player_totals(scores, counts, n_trials, 1, seed)
+    totals_a = totals[:len(lineup_a)].sum(axis=0)
+    totals_b = totals[len(lineup_a):].sum(axis=0)
+    return {
+        "win_prob_a": float(np.mean(totals_a > totals_b)),
+        "tie_prob": float(np.mean(totals_a == totals_b)),
+        "totals_a": totals_a,
+        "totals_b": totals_b,
+    }
+
+
+def simulate_rest_of_season(full_data: pd.DataFrame, roster: list, n_weeks: int, n_trials: int = 100_000,
+                            seed: int = 0) -> dict:
+    """
+    Distribution of a roster's total points over the next n_weeks games.
+
+    Returns:
+        dict: "totals" (n_trials,), "percentiles" {p: points} for p in 10/25/50/75/90, and
+        "by_player", a frame of each player's median and 10th/90th percentile.
+    """
+    scores, counts = score_samples(full_data, roster)
+    player_totals = simulate_player_totals(scores, counts, n_trials, n_weeks, seed)
+    totals = player_totals.sum(axis=0)
+    by_player = pd.DataFrame({
+        "player": roster,
+        "p10": np.percentile(player_totals, 10, axis=1),
+        "median": np.percentile(player_totals, 50, axis=1),
+        "p90": np.percentile(player_totals, 90, axis=1),
+    })
+    return {
+        "totals": totals,
+        "percentiles": {p: float(np.percentile(totals, p)) for p in (10, 25, 50, 75, 90)},
+        "by_player": by_player,
+    }
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+MIN_GAMES = 3  # Default games played in the week window to qualify for a position's pool
+
+
+def position_standings(positional_data: pd.DataFrame, min_games: int = MIN_GAMES) -> dict:
+    """
+    Totals and averages for every player at a position over the rows given, each with dense
+    ranks, percentiles and z-scores for every numeric stat in one pass.
+
+    Only players with at least `min_games` games define the pool (capped at the most games
+    anyone played, so short windows still have a pool). Every player is placed against that
+    pool, so one-game backups are still ranked but no longer push starters down.
+
+    Args:
+        positional_data (pd.DataFrame): Weekly rows for one position, already week-filtered.
+        min_games (int): Games needed to qualify for the pool.
+
+    Returns:
+        dict: {"games": Series, "totals": {...}, "averages": {...}} where each inner dict holds
+        "ranks", "percentiles" and "zscores" frames shaped like make_position_ranks' output.
+    """
+    numeric = positional_data.select_dtypes(include='number')
+    grouped = numeric.groupby(positional_data['player_display_name'])
+    games = grouped.size()
+    qualified = (games >= min(min_games, games.max())).to_numpy()
+
+    return {
+        "games": games,
+        "totals": _standings(grouped.sum(), qualified),
+        "averages": _standings(grouped.mean(), qualified),
+    }
+
+
+def _standings(values: pd.DataFrame, qualified: np.ndarray) -> dict:
+    """
+    Places every row of `values` against the qualified rows, for all columns at once: the
+    pool is sorted once column-wise and every player is compared against it in one
+    broadcast, so no step loops over stats in Python.
+    """
+    matrix = values.to_numpy(dtype='float64')
+    pool = np.sort(matrix[qualified], axis=0)  # NaNs sort last in each column
+    present = ~np.isnan(pool)
+    pool_size = present.sum(axis=0)
+    # A sorted value starts a new distinct value when it differs from the one above it
+    distinct = present.copy()
+    distinct[1:] &= pool[1:] != pool[:-1]
+
+    # (players, pool, stats) comparisons; NaN compares False, so it never counts
+    at_or_below = (pool[None, :, :] <= matrix[:, None, :]).sum(axis=1)
+    distinct_above = ((pool[None, :, :] > matrix[:, None, :]) & distinct[None, :, :]).sum(axis=1)
+
+    missing = np.isnan(matrix) | (pool_size == 0)
+    # Dense rank: one more than the number of distinct pool values above the player's
+    ranks = np.where(missing, np.nan, 1.0 + distinct_above)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        percentiles = np.where(missing, np.nan, 100 * at_or_below / pool_size)
+        # Mean and std by hand: np.nanmean/np.nanstd warn on the all-NaN columns some positions have
+        mean = np.where(present, pool, 0.0).sum(axis=0) / pool_size
+        std = np.sqrt(np.where(present, (pool - mean) ** 2, 0.0).sum(axis=0) / pool_size)
+        zscores = np.where(std > 0, (matrix - mean) / std, 0.0)
+    zscores[missing] = np.nan
+
+    def frame(data):
+        result = pd.DataFrame(data, columns=values.columns)
+        result.insert(0, 'player_display_name', values.index.to_numpy())
+        return result
+
+    return {"ranks": frame(ranks), "percentiles": frame(percentiles), "zscores": frame(zscores)}
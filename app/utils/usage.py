@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+# {stat: label} for the team shares computed per week and per window
+USAGE_STATS = {
+    'targets': 'Target Share',
+    'carries': 'Carry Share',
+    'receiving_air_yards': 'Air Yard Share',
+    'calc_fantasy_points': 'Points Share',
+    # Present once play-by-play has been ingested (utils/pbp.py)
+    'redzone_targets': 'RZ Target Share',
+    'redzone_carries': 'RZ Carry Share',
+}
+TEAM_KEYS = ['recent_team', 'season', 'week']
+
+
+def add_team_shares(scored: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adds '{stat}_team_total' and '{stat}_team_share' columns for every usage stat: each
+    player's share of their team's weekly total, from one grouped transform over team-weeks.
+
+    Returns:
+        pd.DataFrame: A copy of scored with the team columns appended.
+    """
+    stats = [s for s in USAGE_STATS if s in scored.columns]
+    values = scored[stats].astype('float64')
+    team_totals = values.groupby([scored[k] for k in TEAM_KEYS]).transform('sum')
+    with np.errstate(invalid='ignore', divide='ignore'):
+        shares = (values / team_totals.where(team_totals != 0)).fillna(0.0)
+    return pd.concat([
+        scored,
+        team_totals.add_suffix('_team_total'),
+        shares.add_suffix('_team_share'),
+    ], axis=1)
+
+
+def team_window_shares(team_weeks: pd.DataFrame, weeks: tuple) -> pd.DataFrame:
+    """
+    Every player's share of the team's usage over an inclusive week window.
+
+    Args:
+        team_weeks (pd.DataFrame): add_team_shares output for one team.
+        weeks (tuple): (first_week, last_week), inclusive.
+
+    Returns:
+        pd.DataFrame: One row per player with position, games and one share column per stat.
+    """
+    stats = [s for s in USAGE_STATS if s in team_weeks.columns]
+    window = team_weeks.loc[team_weeks['week'].between(*weeks)]
+    player_totals = window.groupby(['player_display_name', 'position'])[stats].sum()
+    # Team totals repeat on every player row of a week; take each week's once
+    team_totals = window.drop_duplicates('week')[[f"{s}_team_total" for s in stats]].sum().to_numpy()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        shares = pd.DataFrame(player_totals.to_numpy() / np.where(team_totals != 0, team_totals, np.nan),
+                              index=player_totals.index, columns=[USAGE_STATS[s] for s in stats]).fillna(0.0)
+    shares['Games'] = window.groupby(['player_display_name', 'position']).size()
+    return shares.reset_index()